@@ -1,26 +1,27 @@
+import numpy as np
+
+
 def rk4(f, x0, y0, h, xn):
     """
     使用经典四阶龙格-库塔方法求解常微分方程
     
     参数:
     f : 函数 dy/dx = f(x, y)
-    x0, y0 : 初始条件
+    x0, y0 : 初始条件，y0 为向量时求解方程组（f 返回同形状的向量）
     h : 步长
     xn : 终点
     
     返回:
-    x_values : x值列表
-    y_values : 对应的y值列表
+    x_values : x值数组 (n,)
+    y_values : 对应的y值数组 (n,) 或 (n, 方程个数)，预先分配
     """
-    x_values = [x0]
-    y_values = [y0]
-    
-    x = x0
-    y = y0
-    
     # 计算迭代次数
     n = int((xn - x0) / h) + 1
     
+    x_values = np.empty(n)
+    y_values = np.empty((n,) + np.shape(y0))
+    x_values[0], y_values[0] = x0, y0
+    
     """
     #二阶：
     k1=f(x,y)
@@ -37,21 +38,15 @@ def rk4(f, x0, y0, h, xn):
     """
     
     for i in range(1, n):#修改阶数
+        x, y = x_values[i - 1], y_values[i - 1]
     
         k1 = f(x, y)
         k2 = f(x + h/2, y + k1 * h/2)
         k3 = f(x + h/2, y + k2 * h/2)
         k4 = f(x + h, y + k3 * h)
         
-        y_next = y + (h/6) * (k1 + 2*k2 + 2*k3 + k4)
-        x_next = x + h
-        
-        # 更新值
-        x = x_next
-        y = y_next
-        
-        x_values.append(x)
-        y_values.append(y)
+        y_values[i] = y + (h/6) * (k1 + 2*k2 + 2*k3 + k4)
+        x_values[i] = x + h
     
     return x_values, y_values
 
@@ -25,11 +25,13 @@ y_implicit[0] = 0.0       # y(0)
 y_implicit[1] = 0.181     # y(0.2) 相同启动值
 
 # 显式二阶Adams-Bashforth方法
+# 上一步的导数值留到下一步复用，每步只调用一次 f
+f_prev = f(x_points[0], y_explicit[0])
 for i in range(1, n-1):
     # 显式公式: y_{n+1} = y_n + h/2 * [3f(x_n,y_n) - f(x_{n-1},y_{n-1})]
-    term1 = 3 * f(x_points[i], y_explicit[i])
-    term2 = f(x_points[i-1], y_explicit[i-1])
-    y_explicit[i+1] = y_explicit[i] + (h/2) * (term1 - term2)
+    f_curr = f(x_points[i], y_explicit[i])
+    y_explicit[i+1] = y_explicit[i] + (h/2) * (3 * f_curr - f_prev)
+    f_prev = f_curr
 
 # 隐式二阶Adams-Moulton方法
 for i in range(1, n-1):
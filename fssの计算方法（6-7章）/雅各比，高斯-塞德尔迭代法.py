@@ -1,5 +1,13 @@
+import os
+import sys
+
 import numpy as np
 
+# CSR 稀疏矩阵与第六章的迭代法共用同一实现
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                os.pardir, "第六章-方程组的数值解法(矩阵求解方法)"))
+from 稀疏矩阵 import CSRMatrix
+
 # 定义系数矩阵和右端向量
 A = np.array([
     [4, -1, 0, -1, 0, 0],
@@ -12,12 +20,23 @@ A = np.array([
 
 b = np.array([2, 3, 2, 2, 1, 2], dtype=float)
 
-# 雅可比迭代法
+# 雅可比迭代法（A 可为稠密数组或 CSRMatrix）
 def jacobi_solver(A, b, tol=1e-5, max_iter=1000):
     n = len(b)
     x = np.zeros(n)  # 初始解向量
     x_new = np.zeros(n)  # 存储新解
     
+    if isinstance(A, CSRMatrix):
+        # 稀疏矩阵：x_new = (b - (A x - D x)) / D，每轮 O(nnz)
+        diag = A.diagonal()
+        for it in range(max_iter):
+            x_new = (b - (A @ x - diag * x)) / diag
+            residual = np.max(np.abs(b - A @ x_new))
+            if residual < tol:
+                return x_new, it + 1
+            x = x_new
+        return x, max_iter
+
     for it in range(max_iter):
         # 遍历每个方程
         for i in range(n):
@@ -40,11 +59,21 @@ def jacobi_solver(A, b, tol=1e-5, max_iter=1000):
     
     return x, max_iter
 
-# 高斯-塞德尔迭代法
+# 高斯-塞德尔迭代法（A 可为稠密数组或 CSRMatrix）
 def gauss_seidel_solver(A, b, tol=1e-5, max_iter=1000):
     n = len(b)
     x = np.zeros(n)  # 初始解向量
     
+    if isinstance(A, CSRMatrix):
+        # 稀疏矩阵：按行扫描非零元，每轮 O(nnz)
+        diag = A.diagonal()
+        for it in range(max_iter):
+            A.sor_sweep(b, x, 1.0, diag)
+            residual = np.max(np.abs(b - A @ x))
+            if residual < tol:
+                return x, it + 1
+        return x, max_iter
+
     for it in range(max_iter):
         x_old = x.copy()  # 保存上一轮迭代的解
         
@@ -89,4 +118,11 @@ print("\n精确解:", np.round(exact_solution, 6))
 error_jacobi = np.max(np.abs(x_jacobi - exact_solution))
 error_gs = np.max(np.abs(x_gs - exact_solution))
 print(f"\n雅可比法最大误差: {error_jacobi:.6e}")
-print(f"高斯-塞德尔法最大误差: {error_gs:.6e}")
\ No newline at end of file
+print(f"高斯-塞德尔法最大误差: {error_gs:.6e}")
+
+# 同一方程组改用 CSR 稀疏存储
+A_csr = CSRMatrix.from_dense(A)
+x_jacobi_csr, _ = jacobi_solver(A_csr, b)
+x_gs_csr, _ = gauss_seidel_solver(A_csr, b)
+print(f"\nCSR 存储: 雅可比与稠密结果最大差 {np.max(np.abs(x_jacobi_csr - x_jacobi)):.1e}, "
+      f"高斯-塞德尔最大差 {np.max(np.abs(x_gs_csr - x_gs)):.1e}")
@@ -1,23 +1,25 @@
 import numpy as np
 
-def 梯形法(h: float = 0.1, x_end: float = 1.5):
+def 梯形法(h: float = 0.1, x_end: float = 1.5, y0=2.0):
     """
-    使用梯形法则计算 [0, x_end] 区间上 y' = -y，y(0) = 1 的数值解。
+    使用梯形法则计算 [0, x_end] 区间上 y' = -y，y(0) = y0 的数值解。
+
+    y0 可以是向量（各分量独立满足 y' = -y），此时逐步整体更新。
 
     返回值
     -------
     x : ndarray
         网格点（大小为 n+1）。
     y : ndarray
-        网格点上的数值解。
+        网格点上的数值解，形状 (n+1,) 或 (n+1, 方程个数)。
     """
     # 步数 n 满足 n * h = x_end
     n = int(round(x_end / h))
     x = np.linspace(0.0, x_end, n + 1)
 
     # 预分配解数组
-    y = np.empty(n + 1)
-    y[0] = 2.0
+    y = np.empty((n + 1,) + np.shape(y0))
+    y[0] = y0
 
     # 预计算常数放大因子 rho = (2 - h) / (2 + h)
     rho = (2.0 - h) / (2.0 + h)
@@ -10,16 +10,16 @@ class EulerSolver:
         微分方程右端函数 f(x, y)
     x0 : float
         初始点 x0
-    y0 : float
-        初始值 y0
+    y0 : float 或 array_like
+        初始值 y0；为向量时求解方程组，f(x, y) 返回同形状的向量
     h : float
         步长
     x_end : float
         终点
     n : int
         步数
-    xs, ys, fs : list[float]
-        离散节点、近似解及函数值
+    xs, ys, fs : ndarray
+        离散节点 (n+1,)、近似解及函数值 (n+1,) 或 (n+1, m)
     """
     def __init__(self, f, x0, y0, h, x_end):
         if h <= 0:
@@ -28,7 +28,7 @@ class EulerSolver:
             raise ValueError("终点 x_end 必须大于 x0")
         self.f = f
         self.x0 = float(x0)
-        self.y0 = float(y0)
+        self.y0 = np.asarray(y0, dtype=float)
         self.h = float(h)
         self.x_end = float(x_end)
         # 计算实际步数，确保覆盖到区间终点
@@ -37,19 +37,17 @@ class EulerSolver:
 
     # ---------------- 核心求解 ---------------- #
     def solve(self):
-        xs = [self.x0]
-        ys = [self.y0]
-        fs = []
-        for _ in range(self.n):
-            x_n, y_n = xs[-1], ys[-1]
-            f_n = self.f(x_n, y_n)
-            fs.append(f_n)
-            y_next = y_n + self.h * f_n
-            x_next = x_n + self.h
-            xs.append(x_next)
-            ys.append(y_next)
+        # 预分配 (n+1,) + y0.shape 的缓冲区，每步一次（向量）f 调用
+        xs = np.empty(self.n + 1)
+        ys = np.empty((self.n + 1,) + self.y0.shape)
+        fs = np.empty_like(ys)
+        xs[0], ys[0] = self.x0, self.y0
+        for i in range(self.n):
+            fs[i] = self.f(xs[i], ys[i])
+            ys[i + 1] = ys[i] + self.h * fs[i]
+            xs[i + 1] = xs[i] + self.h
         # 记录最后一点的 f 值
-        fs.append(self.f(xs[-1], ys[-1]))
+        fs[-1] = self.f(xs[-1], ys[-1])
         self.xs, self.ys, self.fs = xs, ys, fs
         return xs, ys
 
@@ -62,16 +60,18 @@ class EulerSolver:
         add(f"  步长 h = {self.h}")
         add("  递推公式:  y_{n+1} = y_n + h * f(x_n, y_n)")
         add("")
+        # 向量状态时各分量用空格隔开
+        fmt = lambda v, w: " ".join(f"{c:{w}.{digits}f}" for c in np.ravel(v))
         header = f"{'n':>4} | {'x_n':>12} | {'y_n':>12} | {'f(x_n,y_n)':>14}"
         add(header)
         add("-" * len(header))
         for i in range(len(self.xs) - 1):
-            add(f"{i:4d} | {self.xs[i]:12.{digits}f} | {self.ys[i]:12.{digits}f} | {self.fs[i]:14.{digits}f}")
+            add(f"{i:4d} | {self.xs[i]:12.{digits}f} | {fmt(self.ys[i], 12)} | {fmt(self.fs[i], 14)}")
         # 最后一个节点
         n = len(self.xs) - 1
-        add(f"{n:4d} | {self.xs[-1]:12.{digits}f} | {self.ys[-1]:12.{digits}f} | {self.fs[-1]:14.{digits}f}")
+        add(f"{n:4d} | {self.xs[-1]:12.{digits}f} | {fmt(self.ys[-1], 12)} | {fmt(self.fs[-1], 14)}")
         add("")
-        add(f"  最终结果:  y({self.xs[-1]}) ≈ {self.ys[-1]:.{digits}f}")
+        add(f"  最终结果:  y({self.xs[-1]}) ≈ {fmt(self.ys[-1], 0)}")
         return "\n".join(ln)
 
 
@@ -97,3 +97,10 @@ f3 = lambda x, y: r * y * (1 - y / K)
 solver3 = EulerSolver(f3, x0=0.0, y0=2.0, h=0.2, x_end=2.0)
 solver3.solve()
 print(solver3.generate_report(digits=6))
+
+# ======================= 示例 4 ======================= #
+print("\n\n示例 4：方程组 y1' = y2, y2' = -y1, y(0)=(1, 0), h=0.2, 区间 [0,1]")
+f4 = lambda x, y: np.array([y[1], -y[0]])
+solver4 = EulerSolver(f4, x0=0.0, y0=[1.0, 0.0], h=0.2, x_end=1.0)
+solver4.solve()
+print(solver4.generate_report(digits=6))
@@ -0,0 +1,171 @@
+import numpy as np
+
+# Dormand–Prince 5(4) 系数
+C = np.array([0, 1/5, 3/10, 4/5, 8/9, 1, 1])
+A = [np.array([]),
+     np.array([1/5]),
+     np.array([3/40, 9/40]),
+     np.array([44/45, -56/15, 32/9]),
+     np.array([19372/6561, -25360/2187, 64448/6561, -212/729]),
+     np.array([9017/3168, -355/33, 46732/5247, 49/176, -5103/18656]),
+     np.array([35/384, 0, 500/1113, 125/192, -2187/6784, 11/84])]
+B = np.array([35/384, 0, 500/1113, 125/192, -2187/6784, 11/84, 0])
+# 五阶解与嵌入四阶解之差的系数，用于误差估计
+E = np.array([71/57600, 0, -71/16695, 71/1920, -17253/339200, 22/525, -1/40])
+# 稠密输出：y(x_n + θh) = y_n + h Σ_s K_s (P[s] · [θ, θ², θ³, θ⁴])
+P = np.array([
+    [1, -8048581381/2820520608, 8663915743/2820520608, -12715105075/11282082432],
+    [0, 0, 0, 0],
+    [0, 131558114200/32700410799, -68118460800/10900136933, 87487479700/32700410799],
+    [0, -1754552775/470086768, 14199869525/1410260304, -10690763975/1880347072],
+    [0, 127303824393/49829197408, -318862633887/49829197408, 701980252875/199316789632],
+    [0, -282668133/205662961, 2019193451/616988883, -1453857185/822651844],
+    [0, 40617522/29380423, -110615467/29380423, 69997945/29380423]])
+
+
+class ODESolution:
+    """
+    自适应积分的结果。
+
+    Attributes
+    ----------
+    x : ndarray, (n,)              接受的步点
+    y : ndarray, (n,) 或 (n, m)    步点上的数值解（标量方程为一维）
+    accepted, rejected : int       接受 / 拒绝的步数
+    n_fev : int                    调用 f 的次数
+
+    实例可直接调用：sol(xq) 用每步内的四阶连续插值（稠密输出）
+    给出任意 xq 处的解，不需要额外调用 f。
+    """
+
+    def __init__(self, x, y, K, scalar, accepted, rejected, n_fev):
+        self.x = np.asarray(x)
+        self._y = np.asarray(y)
+        self._K = np.asarray(K)               # (步数, 7, m)
+        self._scalar = scalar
+        self.y = self._y[:, 0] if scalar else self._y
+        self.accepted, self.rejected, self.n_fev = accepted, rejected, n_fev
+
+    def __call__(self, xq):
+        xq = np.asarray(xq, dtype=float)
+        if np.any((xq < self.x[0]) | (xq > self.x[-1])):
+            raise ValueError(f"稠密输出只在 [{self.x[0]}, {self.x[-1]}] 内有定义")
+        flat = xq.ravel()
+        i = np.clip(np.searchsorted(self.x, flat, side='right') - 1, 0, self.x.size - 2)
+        h = self.x[i + 1] - self.x[i]
+        theta = (flat - self.x[i]) / h
+        Q = np.stack([theta, theta ** 2, theta ** 3, theta ** 4], axis=-1) @ P.T  # (q, 7)
+        out = self._y[i] + h[:, None] * np.einsum('qs,qsm->qm', Q, self._K[i])
+        out = out.reshape(xq.shape + (out.shape[-1],))
+        return out[..., 0] if self._scalar else out
+
+
+def _rms(v):
+    return np.sqrt(np.mean(v ** 2))
+
+
+def dormand_prince(f, x0, y0, xn, rtol=1e-6, atol=1e-9, h0=None, max_steps=100_000):
+    """
+    Dormand–Prince 5(4) 自适应龙格-库塔法，步长由嵌入误差估计自动控制。
+
+    参数与 runge_kutta_method 相同：f(x, y) 为 dy/dx，y0 可为标量或向量。
+    每步 6 次新的 f 调用（第 7 级即下一步的第 1 级，FSAL）。
+    误差按 RMS 范数 ||err / (atol + rtol·|y|)|| ≤ 1 判断接受，
+    步长因子 0.9·err^(-1/5)，限制在 [0.2, 5] 内。
+
+    Returns
+    -------
+    ODESolution
+    """
+    if not xn > x0:
+        raise ValueError("要求 xn > x0")
+    scalar = np.ndim(y0) == 0
+    y = np.atleast_1d(np.asarray(y0, dtype=float)).copy()
+
+    def rhs(x, y):
+        return np.atleast_1d(np.asarray(f(x, y[0] if scalar else y), dtype=float))
+
+    k = rhs(x0, y)
+    n_fev = 1
+    if h0 is None:
+        # Hairer 的初始步长估计
+        scale = atol + rtol * np.abs(y)
+        d0, d1 = _rms(y / scale), _rms(k / scale)
+        h = 1e-6 if d0 < 1e-5 or d1 < 1e-5 else 0.01 * d0 / d1
+        k_euler = rhs(x0 + h, y + h * k)
+        n_fev += 1
+        d2 = _rms((k_euler - k) / scale) / h
+        h1 = (0.01 / max(d1, d2)) ** (1 / 5) if max(d1, d2) > 1e-15 else max(1e-6, h * 1e-3)
+        h = min(100 * h, h1)
+    else:
+        h = float(h0)
+
+    xs, ys, Ks = [x0], [y.copy()], []
+    x = x0
+    accepted = rejected = 0
+    K = np.empty((7, y.size))
+    while x < xn:
+        if accepted + rejected >= max_steps:
+            raise RuntimeError(f"超过最大步数 {max_steps}")
+        if h <= 1e-14 * max(abs(x), 1.0):
+            raise RuntimeError(f"x = {x} 处步长过小，解可能在此处失去定义")
+        h = min(h, xn - x)
+        K[0] = k
+        for s in range(1, 7):
+            K[s] = rhs(x + C[s] * h, y + h * (A[s] @ K[:s]))
+        n_fev += 6
+        y_new = y + h * (B @ K)
+        err = _rms(h * (E @ K) / (atol + rtol * np.maximum(np.abs(y), np.abs(y_new))))
+
+        if err <= 1:
+            x = xn if xn - x - h <= 1e-12 * abs(xn) else x + h
+            y, k = y_new, K[6].copy()
+            xs.append(x)
+            ys.append(y.copy())
+            Ks.append(K.copy())
+            accepted += 1
+            factor = 5.0 if err == 0 else min(5.0, 0.9 * err ** -0.2)
+        else:
+            rejected += 1
+            factor = max(0.2, 0.9 * err ** -0.2)
+        h *= factor
+
+    return ODESolution(xs, ys, Ks, scalar, accepted, rejected, n_fev)
+
+
+# --------------------- DEMO ---------------------
+if __name__ == "__main__":
+    from 集合积分 import rk4_ensemble
+
+    # 与经典 RK4（集合积分.py 的 rk4_ensemble，单个成员）在相同精度下比较 f 调用次数：
+    # y' = y cos x, y(0) = 1，精确解 e^{sin x}；RK4 取误差不超过 DP45 的最大步长
+    f = lambda x, y: y * np.cos(x)
+    exact = lambda x: np.exp(np.sin(x))
+    xq = np.linspace(0, 10, 1001)
+    print("y' = y cos x，x ∈ [0, 10]：")
+    for rtol in (1e-6, 1e-8, 1e-10):
+        sol = dormand_prince(f, 0.0, 1.0, 10.0, rtol=rtol, atol=rtol * 1e-2)
+        err_dp = np.max(np.abs(sol(xq) - exact(xq)))
+        n = 10
+        while True:
+            xs, ys = rk4_ensemble(f, 0.0, [1.0], 10.0 / n, 10.0)
+            err_rk4 = np.max(np.abs(ys[0] - exact(xs)))
+            if err_rk4 <= err_dp:
+                break
+            n = int(np.ceil(n * 1.1))
+        print(f"  rtol={rtol:.0e}：DP45 调用 f {sol.n_fev} 次，稠密输出最大误差 {err_dp:.1e}；"
+              f"同等精度的 RK4 需 {n} 步、调用 f {4 * n} 次")
+
+    # y' = x + y, y(0) = -1 的精确解 y = -x - 1（R-K格式.py 中的例子），换一个非平凡初值
+    exact = lambda x: 2 * np.exp(x) - x - 1
+    sol = dormand_prince(lambda x, y: x + y, 0.0, 1.0, 2.0, rtol=1e-9, atol=1e-12)
+    xq = np.linspace(0, 2, 201)
+    print(f"y' = x + y, y(0) = 1：{sol.accepted} 步，最大误差 {np.max(np.abs(sol(xq) - exact(xq))):.1e}")
+
+    # 向量方程与刚度变化：范德波尔振子 μ = 5
+    mu = 5.0
+    vdp = lambda x, y: np.array([y[1], mu * (1 - y[0] ** 2) * y[1] - y[0]])
+    sol = dormand_prince(vdp, 0.0, [2.0, 0.0], 20.0, rtol=1e-6, atol=1e-9)
+    steps = np.diff(sol.x)
+    print(f"范德波尔 μ=5：接受 {sol.accepted}、拒绝 {sol.rejected}，"
+          f"步长 {steps.min():.1e} ~ {steps.max():.1e}，y(20) = {sol.y[-1]}")
@@ -15,15 +15,18 @@ def adams_predictor_corrector(f, x, y, h):
     """
     四阶阿达姆斯预测-校正方法
     使用RK4生成前3个初始值后进行预测校正
+
+    y 的形状为 (步数,) 或 (步数, 方程个数)。导数值 f(x_i, y_i) 存入同形状的
+    数组，每个节点只算一次，每步只需 2 次 f 调用（预测点与校正点）。
     """
     y_values = y.copy()
+    f_values = np.empty_like(y_values)
+    for i in range(min(4, len(x))):
+        f_values[i] = f(x[i], y_values[i])
     
     for i in range(3, len(x) - 1):
         # 预测阶段（阿达姆斯-巴什福斯四阶公式）
-        f_n = f(x[i], y_values[i])
-        f_nm1 = f(x[i-1], y_values[i-1])
-        f_nm2 = f(x[i-2], y_values[i-2])
-        f_nm3 = f(x[i-3], y_values[i-3])
+        f_n, f_nm1, f_nm2, f_nm3 = f_values[i], f_values[i-1], f_values[i-2], f_values[i-3]
         
         y_pred = y_values[i] + h/24 * (
             55*f_n - 59*f_nm1 + 37*f_nm2 - 9*f_nm3
@@ -35,6 +38,7 @@ def adams_predictor_corrector(f, x, y, h):
         )
         
         y_values[i+1] = y_corr
+        f_values[i+1] = f(x[i+1], y_corr)
         
     return y_values
 
@@ -57,7 +61,7 @@ if __name__ == "__main__":
     n = len(x_values)
     
     # 使用RK4生成前4个初始值
-    y_values = np.zeros(n)
+    y_values = np.zeros((n,) + np.shape(y0))
     y_values[0] = y0
     for i in range(3):
         y_values[i+1] = runge_kutta_4(f, x_values[i], y_values[i], h)
@@ -0,0 +1,239 @@
+import numpy as np
+
+# k 阶阿达姆斯公式的系数，按 f_{n}, f_{n-1}, ... 由新到旧排列
+# 显式（阿达姆斯-巴什福斯）：y_{n+1} = y_n + h Σ_j AB[k][j] f_{n-j}
+AB = {
+    1: np.array([1.0]),
+    2: np.array([3.0, -1.0]) / 2,
+    3: np.array([23.0, -16.0, 5.0]) / 12,
+    4: np.array([55.0, -59.0, 37.0, -9.0]) / 24,
+    5: np.array([1901.0, -2774.0, 2616.0, -1274.0, 251.0]) / 720,
+}
+# 隐式（阿达姆斯-莫尔顿）：y_{n+1} = y_n + h Σ_j AM[k][j] f_{n+1-j}
+AM = {
+    1: np.array([1.0]),
+    2: np.array([1.0, 1.0]) / 2,
+    3: np.array([5.0, 8.0, -1.0]) / 12,
+    4: np.array([9.0, 19.0, -5.0, 1.0]) / 24,
+    5: np.array([251.0, 646.0, -264.0, 106.0, -19.0]) / 720,
+}
+# 局部截断误差主项系数：y(x_{n+1}) - y_{n+1} ≈ γ h^{k+1} y^{(k+1)}
+GAMMA_AB = {1: 1/2, 2: 5/12, 3: 3/8, 4: 251/720, 5: 95/288}
+GAMMA_AM = {1: -1/2, 2: -1/12, 3: -1/24, 4: -19/720, 5: -3/160}
+MAX_ORDER = 5
+
+
+def _rms(v):
+    return np.sqrt(np.mean(v ** 2))
+
+
+def _ring_coefficients(coeffs, size):
+    """
+    把由新到旧排列的系数摆到环形缓冲区的槽位上。
+
+    返回 (size, size) 数组，第 head 行对应最新值存放在槽 head 时的系数，
+    于是 Σ_j c_j f_{n-j} 只需一次 table[head] @ F，不必重排缓冲区。
+    """
+    table = np.zeros((size, size))
+    for head in range(size):
+        table[head, (head - np.arange(coeffs.size)) % size] = coeffs
+    return table
+
+
+def _rescale_matrix(q, ratio):
+    """
+    等距历史 f(x_n - j h)，j = 0..q-1，换成步长 ratio·h 后的插值矩阵：
+    用过这 q 个点的插值多项式求 x_n - j·ratio·h 处的值。
+    """
+    t = -np.arange(q, dtype=float)
+    s = ratio * t
+    M = np.ones((q, q))
+    for j in range(q):
+        for l in range(q):
+            if l != j:
+                M[:, j] *= (s - t[l]) / (t[j] - t[l])
+    return M
+
+
+def abm_solve(f, x0, y0, xn, h, order=4, mode="PECE", adaptive=False, rtol=1e-6, atol=1e-9,
+              max_steps=100_000, return_info=False):
+    """
+    k 阶阿达姆斯-巴什福斯-莫尔顿预测-校正法（k = 1..5），前 k-1 步用 RK4 起步。
+
+    过去的导数值 f_n, f_{n-1}, ... 存放在固定大小的环形缓冲区中，
+    每个节点只算一次：PECE 模式每步 2 次 f 调用（预测点、校正点），
+    PEC 模式每步 1 次（把预测点的导数直接存入历史）。
+    RK4 起步的第一级复用缓冲区中已有的 f_n，每步 3 次新调用。
+
+    adaptive=True 时按 Milne 误差估计
+        err ≈ γ*_k / (γ_k - γ*_k) · (y_corr - y_pred)
+    控制步长与阶数：步长改变时，用过去导数值的插值多项式把历史换算到
+    新的等距网格上（不调用 f）；同一步还用同一个预测点导数估计 k-1、k+1
+    阶的误差，选取允许步长最大的阶数。h 作为初始步长。
+
+    参数:
+    f : f(x, y)，y0 为标量时 y 为标量，否则为 (m,) 数组
+    order : 阶数 k（自适应时为初始阶数）
+    mode : "PECE" | "PEC"
+    rtol, atol, max_steps : 仅自适应时使用
+
+    返回:
+    x : 节点
+    y : (节点数,) 或 (节点数, m) 的数值解
+    info : （return_info=True 时）n_fev、rejected 以及每步所用阶数 orders
+           （RK4 起步步记为 0）
+    """
+    if order not in AB:
+        raise ValueError(f"order 应为 1..{MAX_ORDER}")
+    if mode not in ("PECE", "PEC"):
+        raise ValueError("mode 仅支持 'PECE' | 'PEC'")
+    if h <= 0 or xn <= x0:
+        raise ValueError("要求 h > 0 且 xn > x0")
+    scalar = np.ndim(y0) == 0
+    y = np.atleast_1d(np.asarray(y0, dtype=float)).copy()
+    info = {"n_fev": 0, "rejected": 0, "orders": []}
+
+    def rhs(x, y):
+        info["n_fev"] += 1
+        return np.atleast_1d(np.asarray(f(x, y[0] if scalar else y), dtype=float))
+
+    size = MAX_ORDER if adaptive else order
+    ab_ring = {k: _ring_coefficients(AB[k], size) for k in AB}
+    am_ring = {k: _ring_coefficients(AM[k][1:], size) for k in AM}
+    F = np.zeros((size, y.size))
+    head, n_valid = -1, 0
+
+    def push(fx):
+        nonlocal head, n_valid
+        head = (head + 1) % size
+        F[head] = fx
+        n_valid = min(n_valid + 1, size)
+
+    def rescale(ratio):
+        """步长乘以 ratio，把历史导数值换算到新的等距网格上。"""
+        idx = (head - np.arange(n_valid)) % size
+        F[idx] = _rescale_matrix(n_valid, ratio) @ F[idx]
+
+    n_fixed = int(round((xn - x0) / h))
+    x = x0
+    xs, ys = [x0], [y.copy()]
+    push(rhs(x, y))
+
+    # RK4 起步，k1 复用缓冲区中的 f_n
+    for _ in range(min(order - 1, n_fixed)):
+        k1 = F[head]
+        k2 = rhs(x + h/2, y + h/2 * k1)
+        k3 = rhs(x + h/2, y + h/2 * k2)
+        k4 = rhs(x + h, y + h * k3)
+        y = y + h/6 * (k1 + 2*k2 + 2*k3 + k4)
+        x = x0 + len(xs) * h
+        push(rhs(x, y))
+        xs.append(x)
+        ys.append(y.copy())
+        info["orders"].append(0)
+
+    k = order
+    while (x < xn) if adaptive else (len(xs) <= n_fixed):
+        if adaptive:
+            if len(xs) + info["rejected"] >= max_steps:
+                raise RuntimeError(f"超过最大步数 {max_steps}")
+            if h <= 1e-14 * max(abs(x), 1.0):
+                raise RuntimeError(f"x = {x} 处步长过小，解可能在此处失去定义")
+            if x + h > xn or xn - x - h <= 1e-12 * abs(xn):
+                rescale((xn - x) / h)
+                h = xn - x
+        x_new = xn if adaptive and h == xn - x else (x + h if adaptive else x0 + len(xs) * h)
+
+        y_pred = y + h * (ab_ring[k][head] @ F)
+        f_pred = rhs(x_new, y_pred)
+        y_corr = y + h * (AM[k][0] * f_pred + am_ring[k][head] @ F)
+
+        if adaptive:
+            scale = atol + rtol * np.maximum(np.abs(y), np.abs(y_corr))
+            errors = {}
+            for q in (k - 1, k, k + 1):
+                if 1 <= q <= min(MAX_ORDER, n_valid):
+                    if q == k:
+                        pred, corr = y_pred, y_corr
+                    else:
+                        pred = y + h * (ab_ring[q][head] @ F)
+                        corr = y + h * (AM[q][0] * f_pred + am_ring[q][head] @ F)
+                    c = GAMMA_AM[q] / (GAMMA_AB[q] - GAMMA_AM[q])
+                    errors[q] = _rms(c * (corr - pred) / scale)
+            factors = {q: 1.5 if e == 0 else min(1.5, 0.8 * e ** (-1 / (q + 1)))
+                       for q, e in errors.items()}
+            if errors[k] > 1:
+                info["rejected"] += 1
+                ratio = max(0.2, factors[k])
+                rescale(ratio)
+                h *= ratio
+                continue
+
+        push(f_pred if mode == "PEC" else rhs(x_new, y_corr))
+        x, y = x_new, y_corr
+        xs.append(x)
+        ys.append(y.copy())
+        info["orders"].append(k)
+
+        if adaptive:
+            # 选允许步长最大的阶数；步长只在能放大 20% 以上时才改变，
+            # 避免频繁换算历史
+            k = max(factors, key=factors.get)
+            if factors[k] >= 1.2:
+                rescale(factors[k])
+                h *= factors[k]
+
+    xs, ys = np.array(xs), np.array(ys)
+    info["orders"] = np.array(info["orders"])
+    y_out = ys[:, 0] if scalar else ys
+    if return_info:
+        return xs, y_out, info
+    return xs, y_out
+
+
+# --------------------- DEMO ---------------------
+if __name__ == "__main__":
+    import importlib.util
+    import os
+
+    # 与 阿达姆斯预测-校正方法[等待测试].py 对比：y' = y - 2x/y, y(0) = 1，精确解 √(1+2x)
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "阿达姆斯预测-校正方法[等待测试].py")
+    spec = importlib.util.spec_from_file_location("adams_script", path)
+    script = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(script)
+    x = np.arange(0.0, 1.0 + 0.1, 0.1)
+    y = np.zeros(x.size)
+    y[0] = 1.0
+    for i in range(3):
+        y[i + 1] = script.runge_kutta_4(script.f, x[i], y[i], 0.1)
+    y_script = script.adams_predictor_corrector(script.f, x, y, 0.1)
+    xs, ys, info = abm_solve(script.f, 0.0, 1.0, 1.0, 0.1, return_info=True)
+    print(f"四阶 PECE 与 adams_predictor_corrector 的最大差 {np.max(np.abs(ys - y_script)):.1e}，"
+          f"f 调用 {info['n_fev']} 次（起步 1 + 3×4，之后每步 2 次）")
+
+    # 各阶收敛性：y' = y cos x, y(0) = 1，精确解 e^{sin x}
+    f = lambda x, y: y * np.cos(x)
+    exact = lambda x: np.exp(np.sin(x))
+    print("\ny' = y cos x，x ∈ [0, 10] 上的最大误差：")
+    print(f"{'阶数':>4} | {'h = 0.05':>10} | {'h = 0.025':>10} | {'比值':>6} | {'PEC h=0.025':>11}")
+    for k in range(1, MAX_ORDER + 1):
+        e1, e2, e_pec = (np.max(np.abs(y - exact(x))) for x, y in
+                         (abm_solve(f, 0.0, 1.0, 10.0, h, k, mode)
+                          for h, mode in ((0.05, "PECE"), (0.025, "PECE"), (0.025, "PEC"))))
+        print(f"{k:>6} | {e1:>10.2e} | {e2:>10.2e} | {e1 / e2:>6.1f} | {e_pec:>11.2e}")
+
+    # 自适应步长与阶数：范德波尔振子 μ = 5，与 Dormand–Prince 5(4) 比较 f 调用次数
+    from 自适应龙格库塔 import dormand_prince
+
+    mu = 5.0
+    vdp = lambda x, y: np.array([y[1], mu * (1 - y[0] ** 2) * y[1] - y[0]])
+    ref = dormand_prince(vdp, 0.0, [2.0, 0.0], 20.0, rtol=1e-12, atol=1e-12).y[-1]
+    print("\n范德波尔 μ=5，x ∈ [0, 20]：")
+    for rtol in (1e-4, 1e-6, 1e-8):
+        xs, ys, info = abm_solve(vdp, 0.0, [2.0, 0.0], 20.0, 1e-3, order=2, adaptive=True,
+                                 rtol=rtol, atol=rtol * 1e-2, return_info=True)
+        dp = dormand_prince(vdp, 0.0, [2.0, 0.0], 20.0, rtol=rtol, atol=rtol * 1e-2)
+        counts = np.bincount(info["orders"], minlength=MAX_ORDER + 1)[1:]
+        print(f"  rtol={rtol:.0e}: ABM {xs.size - 1} 步（拒绝 {info['rejected']}），f 调用 {info['n_fev']}，"
+              f"误差 {np.max(np.abs(ys[-1] - ref)):.1e}，各阶步数 {counts.tolist()}；"
+              f"DP45 f 调用 {dp.n_fev}，误差 {np.max(np.abs(dp.y[-1] - ref)):.1e}")
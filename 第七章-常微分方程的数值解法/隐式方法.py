@@ -0,0 +1,217 @@
+import numpy as np
+from scipy.linalg import lu_factor, lu_solve
+
+# BDF-k：y_{n+1} - hβ f(x_{n+1}, y_{n+1}) = Σ_j a_j y_{n+1-j}，BDF[k] = (β, [a_1, ..., a_k])
+BDF = {
+    1: (1.0, [1.0]),
+    2: (2/3, [4/3, -1/3]),
+    3: (6/11, [18/11, -9/11, 2/11]),
+    4: (12/25, [48/25, -36/25, 16/25, -3/25]),
+    5: (60/137, [300/137, -300/137, 200/137, -75/137, 12/137]),
+}
+METHODS = ("backward_euler", "trapezoid", "bdf2", "bdf3", "bdf4", "bdf5")
+
+
+def _rms(v):
+    return np.sqrt(np.mean(v ** 2))
+
+
+def implicit_solve(f, x0, y0, xn, h, method="bdf2", jac=None, rtol=1e-8, atol=1e-10,
+                   max_newton=8, return_info=False):
+    """
+    定步长隐式方法求解刚性方程 y' = f(x, y)，每步用简化牛顿迭代求解。
+
+    所有方法的每一步都化为同一形式 z - hβ f(x_{n+1}, z) = ψ：
+        backward_euler  β = 1,   ψ = y_n
+        trapezoid       β = 1/2, ψ = y_n + h/2 f_n
+        bdfk            β、ψ 见 BDF 系数表
+    BDF-k 的前 k-1 步用外推后向欧拉法起步：同一步分别走 1, 2, ..., k 个
+    后向欧拉子步，再对子步长做 Aitken–Neville 外推，得到 k 阶的起步值
+    （若用低阶 BDF 起步，BDF3 以上整体只有二阶）；子步也是隐式的，
+    刚性问题上不受显式方法的稳定性限制。
+    牛顿矩阵 I - hβJ 只做一次列主元 LU 分解（LAPACK getrf），在后续步与
+    各次牛顿迭代中反复使用；
+    只有简化牛顿迭代不收敛（或发散）时，才改用每次迭代都重算雅可比矩阵的
+    完全牛顿迭代，并把最后一次的 J 与分解留给后续步；
+    hβ 改变（起步阶段的子步）时用已有的 J 重新分解。
+    f_{n+1} 由 (z - ψ)/(hβ) 得到，接受一步不需要额外调用 f。
+
+    参数:
+    f : f(x, y)，y0 为标量时 y 为标量，否则为 (m,) 数组
+    jac : 可选，jac(x, y) 返回 (m, m) 的雅可比矩阵 ∂f/∂y；
+          不提供时用前向差分（每次 m 次 f 调用）
+    rtol, atol : 牛顿迭代的收敛判据 ||Δz / (atol + rtol·|z|)||_RMS ≤ 1
+    max_newton : 每次牛顿求解的最大迭代次数
+
+    返回:
+    x : (n+1,) 的节点
+    y : (n+1,) 或 (n+1, m) 的数值解
+    info : （return_info=True 时）n_fev / n_jev / n_lu / n_newton 计数
+    """
+    if method not in METHODS:
+        raise ValueError(f"method 仅支持 {' | '.join(METHODS)}")
+    if h <= 0 or xn <= x0:
+        raise ValueError("要求 h > 0 且 xn > x0")
+    scalar = np.ndim(y0) == 0
+    y = np.atleast_1d(np.asarray(y0, dtype=float)).copy()
+    m = y.size
+    info = {"n_fev": 0, "n_jev": 0, "n_lu": 0, "n_newton": 0}
+
+    def rhs(x, y):
+        info["n_fev"] += 1
+        return np.atleast_1d(np.asarray(f(x, y[0] if scalar else y), dtype=float))
+
+    def jacobian(x, y, fy):
+        info["n_jev"] += 1
+        if jac is not None:
+            return np.atleast_2d(np.asarray(jac(x, y[0] if scalar else y), dtype=float))
+        eps = np.sqrt(np.finfo(float).eps) * np.maximum(np.abs(y), 1.0)
+        J = np.empty((m, m))
+        for j in range(m):
+            yj = y.copy()
+            yj[j] += eps[j]
+            J[:, j] = (rhs(x, yj) - fy) / eps[j]
+        return J
+
+    def newton(x, z, c, psi, J, lu, full=False):
+        """
+        解 z - c f(x, z) = ψ，返回 (z, J, lu)，不收敛时 z 为 None。
+
+        full=False 为简化牛顿迭代（整个过程沿用 lu）；
+        full=True 时每次迭代都在当前迭代点重算雅可比矩阵并重新分解；
+        初值较差时完全牛顿迭代前几步可能收敛很慢，因此放宽到 3 倍迭代次数，
+        也不做收敛速度检查。
+        """
+        prev = None
+        for _ in range(3 * max_newton if full else max_newton):
+            info["n_newton"] += 1
+            fz = rhs(x, z)
+            if full:
+                J = jacobian(x, z, fz)
+                lu = lu_factor(np.eye(m) - c * J)
+                info["n_lu"] += 1
+            dz = lu_solve(lu, psi - z + c * fz)
+            z = z + dz
+            norm = _rms(dz / (atol + rtol * np.abs(z)))
+            if norm <= 1:
+                return z, J, lu
+            if not full and prev is not None and norm > 0.9 * prev:
+                break  # 收敛过慢或发散
+            prev = norm
+        return None, J, lu
+
+    order = int(method[3:]) if method.startswith("bdf") else 1
+    n = int(round((xn - x0) / h))
+    xs = x0 + h * np.arange(n + 1)
+    ys = np.empty((n + 1, m))
+    ys[0] = y
+    f_cur = rhs(x0, y)
+    J = jacobian(x0, y, f_cur)
+    lu, lu_c = None, None
+
+    def implicit_step(x, z0, c, psi):
+        """解 z - c f(x, z) = ψ；c 改变时重新分解，简化牛顿不收敛时改用完全牛顿。"""
+        nonlocal J, lu, lu_c
+        if lu is None or c != lu_c:
+            lu, lu_c = lu_factor(np.eye(m) - c * J), c
+            info["n_lu"] += 1
+        z, _, _ = newton(x, z0, c, psi, J, lu)
+        if z is None:
+            # 雅可比矩阵已过时：改用完全牛顿迭代，保留最后的 J 与分解供后续步使用
+            z, J, lu = newton(x, z0, c, psi, J, lu, full=True)
+            if z is None:
+                raise RuntimeError(f"x = {x} 处牛顿迭代不收敛，请减小步长 h")
+        return z
+
+    def extrapolated_euler(x, y, q):
+        """q 阶起步步：后向欧拉法以 1..q 个子步走完 [x, x+h]，再逐列外推。"""
+        row = []
+        for j in range(1, q + 1):
+            z, c = y, h / j
+            for s in range(j):
+                z = implicit_step(x + (s + 1) * c, z, c, z)
+            # 后向欧拉的误差按子步长的幂次展开：T_{j,l+1} = T_{j,l} + (T_{j,l} - T_{j-1,l}) / (j/(j-l) - 1)
+            new = [z]
+            for l in range(1, j):
+                new.append(new[l - 1] + (new[l - 1] - row[l - 1]) / (j / (j - l) - 1))
+            row = new
+        return row[-1]
+
+    for i in range(n):
+        if i < order - 1:
+            ys[i + 1] = extrapolated_euler(xs[i], ys[i], order)
+            continue
+        if method == "trapezoid":
+            c, psi = h / 2, ys[i] + h / 2 * f_cur
+        else:
+            beta, a = BDF[order]
+            c = h * beta
+            psi = sum(aj * ys[i - j] for j, aj in enumerate(a))
+        # 线性外推作为初值，不调用 f
+        z0 = ys[i] if i == 0 else 2 * ys[i] - ys[i - 1]
+        ys[i + 1] = implicit_step(xs[i + 1], z0, c, psi)
+        f_cur = (ys[i + 1] - psi) / c
+
+    y_out = ys[:, 0] if scalar else ys
+    if return_info:
+        return xs, y_out, info
+    return xs, y_out
+
+
+# --------------------- DEMO ---------------------
+if __name__ == "__main__":
+    from 梯形法 import 梯形法
+
+    # 梯形法.py 的例子 y' = -y, y(0) = 2：牛顿迭代与闭式递推一致
+    x, y = implicit_solve(lambda x, y: -y, 0.0, 2.0, 1.5, 0.1, "trapezoid")
+    print(f"y' = -y：与 梯形法() 的最大差 {np.max(np.abs(y - 梯形法(0.1, 1.5)[1])):.1e}")
+
+    # 刚性标量方程 y' = -1000 (y - cos x) - sin x, y(0) = 1，精确解 cos x
+    # h = 0.1 时 |hλ| = 100，显式欧拉法每步把误差放大 |1 + hλ| = 99 倍
+    f = lambda x, y: -1000 * (y - np.cos(x)) - np.sin(x)
+    print("\ny' = -1000(y - cos x) - sin x，h = 0.1，x ∈ [0, 2]：")
+    for method in METHODS:
+        x, y, info = implicit_solve(f, 0.0, 1.0, 2.0, 0.1, method, return_info=True)
+        print(f"  {method:<15} y(2) 误差 {abs(y[-1] - np.cos(2)):.1e}，"
+              f"f 调用 {info['n_fev']}，雅可比 {info['n_jev']}，LU {info['n_lu']}")
+
+    # 各阶 BDF 的收敛阶：y' = -y + sin x, y(0) = 1，精确解 1.5 e^{-x} + (sin x - cos x)/2
+    f = lambda x, y: -y + np.sin(x)
+    exact = 1.5 * np.exp(-2.0) + (np.sin(2.0) - np.cos(2.0)) / 2
+    steps = (0.1, 0.05, 0.025, 0.0125)
+    print("\ny' = -y + sin x，x ∈ [0, 2]，y(2) 误差与观测阶 log2(e_h / e_{h/2})：")
+    for k in range(2, 6):
+        errors = [abs(implicit_solve(f, 0.0, 1.0, 2.0, h, f"bdf{k}", rtol=1e-13, atol=1e-15)[1][-1] - exact)
+                  for h in steps]
+        orders = np.log2(np.array(errors[:-1]) / np.array(errors[1:]))
+        print(f"  bdf{k}：误差 {' '.join(f'{e:.1e}' for e in errors)}，"
+              f"观测阶 {' '.join(f'{p:.2f}' for p in orders)}")
+
+    # 大型刚性方程组：热方程 u_t = u_xx 的直线法离散（m = 200 个内点）
+    # 特征值约为 -4/Δx² ≈ -1.6e5，显式欧拉要求 h < 2/1.6e5 ≈ 1.2e-5
+    m = 200
+    grid = np.linspace(0, 1, m + 2)[1:-1]
+    dx2 = (1 / (m + 1)) ** 2
+    lap = (np.diag(-2 * np.ones(m)) + np.diag(np.ones(m - 1), 1) + np.diag(np.ones(m - 1), -1)) / dx2
+    x, u, info = implicit_solve(lambda t, u: lap @ u, 0.0, np.sin(np.pi * grid), 0.5, 0.01, "bdf3",
+                                jac=lambda t, u: lap, return_info=True)
+    exact = np.sin(np.pi * grid) * np.exp(-np.pi ** 2 * 0.5)
+    print(f"\n热方程 m={m}，BDF3 h=0.01（约为显式稳定步长的 800 倍）：{x.size - 1} 步，"
+          f"最大误差 {np.max(np.abs(u[-1] - exact)):.1e}，雅可比 {info['n_jev']} 次，LU {info['n_lu']} 次")
+
+    # 非线性刚性问题：Robertson 化学反应，速率常数相差 10⁹ 倍
+    def robertson(t, y):
+        return np.array([-0.04 * y[0] + 1e4 * y[1] * y[2],
+                         0.04 * y[0] - 1e4 * y[1] * y[2] - 3e7 * y[1] ** 2,
+                         3e7 * y[1] ** 2])
+
+    def robertson_jac(t, y):
+        return np.array([[-0.04, 1e4 * y[2], 1e4 * y[1]],
+                         [0.04, -1e4 * y[2] - 6e7 * y[1], -1e4 * y[1]],
+                         [0, 6e7 * y[1], 0]])
+
+    x, y, info = implicit_solve(robertson, 0.0, [1.0, 0.0, 0.0], 40.0, 0.01, "bdf2",
+                                jac=robertson_jac, return_info=True)
+    print(f"Robertson，BDF2 h=0.01：y(40) = {y[-1]}，和 = {y[-1].sum():.12f}，"
+          f"{x.size - 1} 步中雅可比 {info['n_jev']} 次，LU {info['n_lu']} 次，"
+          f"平均每步牛顿 {info['n_newton'] / (x.size - 1):.2f} 次")
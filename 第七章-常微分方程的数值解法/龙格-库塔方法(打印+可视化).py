@@ -12,12 +12,14 @@ def runge_kutta_method(f, x0, y0, h, xn):
     
     参数:
     f : 微分方程 dy/dx = f(x, y)
-    x0, y0 : 初始条件
+    x0, y0 : 初始条件，y0 为向量时求解方程组（f 返回同形状的向量）
     h : 步长
     xn : 终点
+
+    返回的 y 形状为 (步数,) 或 (步数, 方程个数)，预先分配
     """
     x = np.arange(x0, xn + h, h)
-    y = np.zeros(len(x))
+    y = np.zeros((len(x),) + np.shape(y0))
     y[0] = y0
 
     for i in range(1, len(x)):
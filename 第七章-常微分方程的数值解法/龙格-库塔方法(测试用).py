@@ -1,39 +1,34 @@
+import numpy as np
+
+
 def rk2(f, x0, y0, h, xn):
     """
     使用经典龙格-库塔方法求解常微分方程
     
     参数:
     f : 函数 dy/dx = f(x, y)
-    x0, y0 : 初始条件
+    x0, y0 : 初始条件，y0 为向量时求解方程组（f 返回同形状的向量）
     h : 步长
     xn : 终点
     
     返回:
-    x_values : x值列表
-    y_values : 对应的y值列表
+    x_values : x值数组 (n,)
+    y_values : 对应的y值数组 (n,) 或 (n, 方程个数)，预先分配
     """
-    x_values = [x0]
-    y_values = [y0]
-    
-    x = x0
-    y = y0
-    
     # 计算迭代次数
     n = int((xn - x0) / h) + 1
     
+    x_values = np.empty(n)
+    y_values = np.empty((n,) + np.shape(y0))
+    x_values[0], y_values[0] = x0, y0
+    
     for i in range(1, n):
+        x, y = x_values[i - 1], y_values[i - 1]
         k1 = f(x, y)
         k2 = f(x + h, y + k1 * h)
         
-        y_next = y + (h/2) * (k1 + k2)
-        x_next = x + h
-        
-        # 更新值
-        x = x_next
-        y = y_next
-        
-        x_values.append(x)
-        y_values.append(y)
+        y_values[i] = y + (h/2) * (k1 + k2)
+        x_values[i] = x + h
     
     return x_values, y_values
 
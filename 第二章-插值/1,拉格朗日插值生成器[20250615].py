@@ -1,8 +1,10 @@
 ﻿import numpy as np
-from sympy import symbols, expand, lambdify
+from sympy import symbols, expand
 from sympy import diff, ln, exp, sin, cos, tan, sqrt
 import math
 import matplotlib.pyplot as plt
+from 符号函数缓存 import cached_lambdify
+from 重心插值 import BarycentricInterpolator
 
 # 配置中文字体
 plt.rcParams['font.sans-serif'] = ['SimHei']
@@ -55,11 +57,17 @@ def construct_lagrange_polynomial(selected_x, selected_y):
     print(f"P(x) = {expanded_poly}")
     return expanded_poly
 
-def calculate_interpolation(x_val, selected_x, selected_y, polynomial):
-    """计算插值点并输出详细过程"""
-    x = symbols('x')
-    poly_func = lambdify(x, polynomial, 'numpy')
-    final_value = poly_func(x_val)
+def calculate_interpolation(x_val, selected_x, selected_y, polynomial=None, verbose=True):
+    """
+    计算插值点并输出详细过程
+
+    数值结果由重心插值 BarycentricInterpolator 给出（O(n)，x_val 可为数组），
+    不再 lambdify 展开后的多项式；polynomial 仅为兼容旧调用保留。
+    verbose=True 时仍逐项打印拉格朗日基函数的代入过程（O(n²)）
+    """
+    final_value = BarycentricInterpolator(selected_x, selected_y)(x_val)
+    if not verbose:
+        return final_value
     
     print("\n【代入计算过程】")
     print("-" * 60)
@@ -109,7 +117,7 @@ def calculate_truncation_error(x_val, selected_x, selected_y, n_points, func_exp
     
     # 在区间内生成100个点评估导数
     test_points = np.linspace(interval_min, interval_max, 100)
-    deriv_func = lambdify(x_sym, nth_derivative, 'numpy')
+    deriv_func = cached_lambdify(x_sym, nth_derivative, 'numpy')
     
     max_deriv = -np.inf
     for pt in test_points:
@@ -135,10 +143,8 @@ def calculate_truncation_error(x_val, selected_x, selected_y, n_points, func_exp
     
     return error_bound
 
-def plot_interpolation(x_list, y_list, selected_x, polynomial, x_unknown):
-    """可视化插值结果"""
-    x = symbols('x')
-    poly_func = lambdify(x, polynomial, 'numpy')
+def plot_interpolation(x_list, y_list, selected_x, poly_func, x_unknown):
+    """可视化插值结果（poly_func 为可对数组求值的插值函数）"""
     x_vals = np.linspace(min(x_list) - 0.5, max(x_list) + 0.5, 400)
     y_vals = poly_func(x_vals)
     
@@ -160,8 +166,13 @@ def plot_interpolation(x_list, y_list, selected_x, polynomial, x_unknown):
     plt.grid(True)
     plt.show()
 
-def main(x_list, y_list, x, num_points=3, func_expr=None):
-    """主函数"""
+def main(x_list, y_list, x, num_points=3, func_expr=None, symbolic=True):
+    """
+    主函数
+
+    数值计算与绘图默认走重心插值；symbolic=True 时额外输出
+    基函数与展开多项式的符号报告
+    """
     print("【输入数据】")
     print(f"x_list = {x_list}")
     print(f"y_list = {y_list}")
@@ -181,18 +192,19 @@ def main(x_list, y_list, x, num_points=3, func_expr=None):
     
     print(f"\n【使用节点】x = {', '.join([f'{xi:.1f}' for xi in selected_x])}")
     
-    # 构造插值多项式
-    polynomial = construct_lagrange_polynomial(selected_x, selected_y)
+    # 构造插值多项式（符号报告）
+    if symbolic:
+        construct_lagrange_polynomial(selected_x, selected_y)
     
     # 计算插值点
-    interpolated_value = calculate_interpolation(x, selected_x, selected_y, polynomial)
+    interpolated_value = calculate_interpolation(x, selected_x, selected_y, verbose=symbolic)
     
     # 计算截断误差
     error_bound = calculate_truncation_error(x, selected_x, selected_y, num_points, func_expr)
     
     # 如果原始函数表达式已知，计算真实误差
     if func_expr and interpolated_value is not None:
-        true_func = lambdify(symbols('x'), func_expr, 'numpy')
+        true_func = cached_lambdify(symbols('x'), func_expr, 'numpy')
         try:
             true_value = true_func(x)
             actual_error = abs(true_value - interpolated_value)
@@ -208,7 +220,8 @@ def main(x_list, y_list, x, num_points=3, func_expr=None):
             print(f"计算真实值时出错: {e}")
     
     # 绘制插值曲线
-    plot_interpolation(x_list, y_list, selected_x, polynomial, x)
+    plot_interpolation(x_list, y_list, selected_x,
+                       BarycentricInterpolator(selected_x, selected_y), x)
 
 # 示例调用
 if __name__ == "__main__":
@@ -1,23 +1,17 @@
 ﻿import numpy as np
-from sympy import symbols, expand, lambdify
+from sympy import symbols, expand
 import matplotlib.pyplot as plt
+from 符号函数缓存 import cached_lambdify
+from 节点索引 import NodeIndex
+from 差分表 import DifferenceTable
 
 # 配置中文字体
 plt.rcParams['font.sans-serif'] = ['SimHei']
 plt.rcParams['axes.unicode_minus'] = False
 
 def generate_backward_diff_table(y_list):
-    """生成向后差分表"""
-    y = np.asarray(y_list, dtype=float)
-    n = len(y)
-    diff_table = np.zeros((n, n)) * np.nan
-    diff_table[:, 0] = y
-    
-    for j in range(1, n):
-        for i in range(n-1, j-1, -1):
-            diff_table[i, j] = diff_table[i, j-1] - diff_table[i-1, j-1]
-            
-    return diff_table
+    """生成向后差分表（由 DifferenceTable 的压缩存储展开，空位为 nan）"""
+    return DifferenceTable(y_list).backward_table()
 
 def print_backward_diff_table(x_list, diff_table):
     """打印向后差分表"""
@@ -40,16 +34,15 @@ def print_backward_diff_table(x_list, diff_table):
                 row.append("")
         print(" | ".join(row))
 
-def select_nodes(x, x_list, n_points):
-    """选择以最接近x的右侧节点为终点的连续n_points个节点"""
-    sorted_indices = np.argsort(x_list)
-    x_list_sorted = x_list[sorted_indices]
-    
-    # 找到插入点
-    idx = np.searchsorted(x_list_sorted, x)
-    end = min(len(x_list_sorted) - 1, max(idx, n_points - 1))
-    
-    selected_indices = sorted_indices[end - n_points + 1 : end + 1]
+def select_nodes(x, x_list, n_points, index=None):
+    """选择以最接近x的右侧节点为终点的连续n_points个节点
+
+    对同一组节点多次选点时，传入预先建好的 index = NodeIndex(x_list)，
+    只排序一次，之后每次选点只需二分查找
+    """
+    if index is None:
+        index = NodeIndex(x_list)
+    selected_indices = index.backward_window(x, n_points)
     selected_x = x_list[selected_indices]
     
     return selected_x, selected_indices
@@ -101,7 +94,7 @@ def calculate_and_print_result(x_val, selected_x, diff_row, h, polynomial):
         
         print(f"第{k+1}项: ∇^{k}f/{factorial_k} * product = {diff_row[k]:.4f}/{factorial_k} * {term_s:.4f} = {term_value:.6f}")
     
-    poly_func = lambdify(x_sym, polynomial, 'numpy')
+    poly_func = cached_lambdify(x_sym, polynomial, 'numpy')
     final_value = poly_func(x_val)
     
     print("-" * 60)
@@ -111,7 +104,7 @@ def calculate_and_print_result(x_val, selected_x, diff_row, h, polynomial):
 def plot_interpolation(x_list, y_list, selected_x, polynomial, x_unknown):
     """绘制插值曲线"""
     x_sym = symbols('x')
-    poly_func = lambdify(x_sym, polynomial, 'numpy')
+    poly_func = cached_lambdify(x_sym, polynomial, 'numpy')
     x_vals = np.linspace(min(x_list) - 0.2, max(x_list) + 0.2, 400)
     y_vals = poly_func(x_vals)
     
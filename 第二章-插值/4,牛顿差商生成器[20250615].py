@@ -1,13 +1,21 @@
 ﻿import numpy as np
-from sympy import symbols, expand, lambdify
+from sympy import symbols, expand
 import matplotlib.pyplot as plt
+from 符号函数缓存 import cached_lambdify
+from 节点索引 import NodeIndex
+from 增量牛顿插值 import IncrementalNewtonInterpolator
 plt.rcParams['font.sans-serif'] = ['SimHei']  # 用来正常显示中文标签
 plt.rcParams['axes.unicode_minus'] = False  # 用来正常显示负号
 
 
 def newton_interpolation(x_list, y_list, x):
-    """牛顿插值多项式"""
-    n = len(x_list)
+    """
+    牛顿插值多项式在 x 处的值（x 可为标量或数组）。
+
+    节点逐个追加到 IncrementalNewtonInterpolator，每个节点 O(n) 地补一条
+    差商对角线，不生成整张差商表；求值用 Horner 嵌套乘法。
+    """
+    return IncrementalNewtonInterpolator().extend(x_list, y_list)(x)
 
 def generate_divided_diff_table(x_list, y_list):
     """生成牛顿插商表，并记录每阶差商的计算过程"""
@@ -58,11 +66,17 @@ def print_divided_diff_table(x_list, diff_table, steps):
     for step in steps:
         print(step)
 
-def select_nodes(x, x_list, num_points):
-    """选择距离x最近的num_points个节点，并保持原始顺序"""
-    distances = np.abs(x_list - x)
-    indices = np.argsort(distances)[:num_points]
-    sorted_indices = np.sort(indices)  # 保持原始顺序
+def select_nodes(x, x_list, num_points, index=None):
+    """
+    选择距离x最近的num_points个节点，并保持原始顺序
+
+    对同一组节点多次选点时，传入预先建好的 index = NodeIndex(x_list)，
+    只排序一次，之后每次选点只需二分查找
+    """
+    # 最近的节点在排序后连续，二分查找窗口起点，O(log N + n)
+    if index is None:
+        index = NodeIndex(x_list)
+    sorted_indices = index.nearest(x, num_points)  # 保持原始顺序
     return x_list[sorted_indices], sorted_indices
 
 def format_newton_term(coeffs, x_values, degree):
@@ -136,7 +150,7 @@ def print_newton_interpolation(x, x_list, y_list, diff_table, selected_x, select
 def plot_interpolation(x_list, y_list, selected_x, final_poly, x_unknown):
     """绘制插值曲线与原始点"""
     x_sym = symbols('x')
-    poly_func = lambdify(x_sym, final_poly, 'numpy')
+    poly_func = cached_lambdify(x_sym, final_poly, 'numpy')
 
     x_vals = np.linspace(min(x_list) - 0.2, max(x_list) + 0.2, 400)
     y_vals = poly_func(x_vals)
@@ -1,6 +1,7 @@
 ﻿import numpy as np
-from sympy import symbols, And, simplify, latex, Rational, Matrix, linsolve, fraction, expand, lambdify
+from sympy import symbols, And, simplify, latex, Rational, Matrix, linsolve, fraction, expand
 import matplotlib.pyplot as plt
+from 三次样条数值引擎 import spline_moments, CubicSplineNumeric
 
 # 配置中文字体
 plt.rcParams['font.sans-serif'] = ['SimHei']
@@ -76,8 +77,8 @@ def generate_spline_pieces(x_list, y_list, M, h_list):
     
     return pieces, x
 
-def plot_spline(x_list, y_list, pieces, x):
-    """绘制样条曲线和原始数据点"""
+def plot_spline(x_list, y_list, spline):
+    """绘制样条曲线和原始数据点（spline 为编译后的 CubicSplineNumeric）"""
     print("\n【可视化展示】")
     print("-" * 60)
     
@@ -85,13 +86,9 @@ def plot_spline(x_list, y_list, pieces, x):
     x_min, x_max = min(x_list), max(x_list)
     padding = 0.1 * (x_max - x_min)
     x_vals = np.linspace(x_min - padding, x_max + padding, 500)
-    y_vals = np.zeros_like(x_vals)
     
-    # 计算样条值
-    for i, (cond, expr) in enumerate(pieces):
-        func = lambdify(x, expr, 'numpy')
-        mask = np.vectorize(lambda val: bool(cond.subs(x, val)))(x_vals)
-        y_vals[mask] = func(x_vals[mask])
+    # 计算样条值：二分定位区间后整体求值，定义域外不绘制
+    y_vals = spline(x_vals, extrapolate=False)
     
     # 绘图
     plt.figure(figsize=(12, 7))
@@ -117,8 +114,13 @@ def plot_spline(x_list, y_list, pieces, x):
     plt.tight_layout()
     plt.show()
 
-def cubic_spline_generator(x_list, y_list, boundary_type, boundary_values):
-    """主函数：生成三次样条插值"""
+def cubic_spline_generator(x_list, y_list, boundary_type, boundary_values, numeric=False):
+    """
+    主函数：生成三次样条插值
+
+    numeric=True 时三弯矩方程改走数值快速路径：系数矩阵的分解按
+    (x 节点, 边界类型) 缓存，x 不变时换一组 y 只需 O(n)，不再用 linsolve
+    """
     n = len(x_list) - 1
     # 计算每个区间的步长
     h_list = [x_list[i+1] - x_list[i] for i in range(n)]
@@ -172,7 +174,14 @@ def cubic_spline_generator(x_list, y_list, boundary_type, boundary_values):
         print(f"夹持边界条件：f'({x_list[0]}) = {boundary_values[0]}, f'({x_list[-1]}) = {boundary_values[1]}")
     
     # 求解方程
-    M = solve_moment_equations(A, d, n)
+    if numeric:
+        M = list(spline_moments(x_list, y_list, boundary_type, boundary_values))
+        print("\n【方程组解（数值快速路径）】")
+        print("-" * 60)
+        for i, val in enumerate(M):
+            print(f"M_{i} = {val:.6f}")
+    else:
+        M = solve_moment_equations(A, d, n)
     
     # 构造分段函数（传入步长列表）
     pieces, x = generate_spline_pieces(x_list, y_list, M, h_list)
@@ -191,7 +200,8 @@ def cubic_spline_generator(x_list, y_list, boundary_type, boundary_values):
     print(latex_str)
     
     # 可视化
-    plot_spline(x_list, y_list, pieces, x)
+    spline = CubicSplineNumeric(x_list, y_list, [float(m) for m in M])
+    plot_spline(x_list, y_list, spline)
     
     return pieces
 
@@ -207,4 +217,9 @@ if __name__ == "__main__":
     print("\n【示例2：夹持边界条件】")
     x_list = [0, 1, 2, 3]
     y_list = [0, 0, 0, 0]
-    cubic_spline_generator(x_list, y_list, 'clamped', [1, 0])
\ No newline at end of file
+    cubic_spline_generator(x_list, y_list, 'clamped', [1, 0])
+    
+    # 示例3：节点同示例2、换一组 y，数值快速路径复用已缓存的分解
+    print("\n【示例3：数值快速路径】")
+    y_list = [0, 1, 0, 1]
+    cubic_spline_generator(x_list, y_list, 'clamped', [1, 0], numeric=True)
\ No newline at end of file
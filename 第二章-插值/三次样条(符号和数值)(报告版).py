@@ -1,4 +1,4 @@
-from typing import Sequence, Tuple, Union, Literal
+from typing import Sequence, Tuple, Union, Literal, Optional
 from fractions import Fraction
 import matplotlib.pyplot as plt# 绘图
 import numpy as np # 绘图
@@ -6,6 +6,7 @@ from sympy import (
     symbols, Rational, Matrix, zeros, solve, latex, simplify,
     Symbol, Piecewise, pprint, S
 )
+from 三次样条数值引擎 import spline_moments, CubicSplineNumeric
 
 RealLike = Union[int, float, Fraction, Rational]
 
@@ -45,6 +46,10 @@ class CubicSplineSymbolic:
         内部函数：生成 _report_lines 列表。
     generate_report(self) -> str
         返回完整报告字符串（已经在 fit() 中构建）。
+    moments_numeric(self, bc_type, bc_vals, y=None) -> np.ndarray
+        数值快速路径：复用缓存的分解求浮点 M，换 y 为 O(n)。
+    to_numeric(self) -> CubicSplineNumeric
+        编译为分段系数数组，对数组整体求值与求导，不经 sympy。
     __call__(self, value: RealLike) -> Rational
         样条函数的数值评估（返回 sympy Rational）。
     plot(self)
@@ -177,6 +182,37 @@ class CubicSplineSymbolic:
         # ---------- 4. 生成可读报告 ----------
         self._build_report(bc_type, bc_vals)
 
+    def moments_numeric(self,
+                        bc_type: Literal['natural', 'second', 'first'] = 'natural',
+                        bc_vals: Tuple[RealLike, RealLike] = (0, 0),
+                        y: Optional[Sequence[RealLike]] = None) -> np.ndarray:
+        """
+        数值快速路径：不经 sympy 求解，直接返回浮点三弯矩 M_i = S''(x_i)。
+
+        三弯矩矩阵的分解按 (x 节点, bc_type) 缓存，
+        x 不变、只换一组 y 时重算为 O(n)。
+
+        Parameters
+        ----------
+        bc_type, bc_vals : 同 fit()
+        y : 新的纵坐标（与 self.x 等长），为 None 时使用 self.y
+        """
+        ys = self.y if y is None else y
+        return spline_moments([float(xi) for xi in self.x],
+                              [float(yi) for yi in ys],
+                              bc_type, tuple(float(v) for v in bc_vals))
+
+    def to_numeric(self) -> CubicSplineNumeric:
+        """
+        把 fit() 得到的样条编译为 CubicSplineNumeric：各区间系数存为浮点数组，
+        用 np.searchsorted 定位区间，可对整个数组求 S、S'、S''。
+        """
+        if self.M is None:
+            raise RuntimeError("请先调用 fit()")
+        return CubicSplineNumeric([float(v) for v in self.x],
+                                  [float(v) for v in self.y],
+                                  [float(v) for v in self.M])
+
     # ----------------- 报告 -----------------
 
     def _build_report(self,
@@ -266,9 +302,9 @@ class CubicSplineSymbolic:
         if self.polys == []:
             raise RuntimeError("请先调用 fit() 计算样条")
 
-        # 生成插值点
+        # 生成插值点（编译后的数值样条整体求值）
         x_vals = np.linspace(float(self.x[0]), float(self.x[-1]), 1000)
-        y_vals = [float(self(value)) for value in x_vals]
+        y_vals = self.to_numeric()(x_vals)
 
         plt.figure(figsize=(10, 6))
         plt.plot(x_vals, y_vals, label="Cubic Spline")
@@ -362,6 +398,10 @@ def demo():
     spline3.fit(bc_type='natural')
     print(spline3.generate_report())
 
+    # ---------- 示例 4：节点不变、换 y 的数值快速路径 ----------
+    print("数值 M (y = ys2):  ", spline3.moments_numeric('natural'))
+    print("数值 M (y = -ys2): ", spline3.moments_numeric('natural', y=[-v for v in ys2]))
+
 
 if __name__ == "__main__":
     demo()
@@ -0,0 +1,126 @@
+from math import factorial
+from typing import Sequence
+
+import numpy as np
+
+
+class PiecewisePolynomial:
+    """
+    分段多项式：各段系数存于一个连续数组，查询时一次向量化求值。
+
+    在第 i 段 [b_i, b_{i+1}] 上，以 t = x - b_i 为局部变量
+        P_i(t) = c[0, i] + c[1, i] t + ... + c[k, i] t^k
+    区间定位用 np.searchsorted（二分查找），求值用 Horner 格式。
+    分段线性、分段二次与分段三次 Hermite 插值都只是不同的系数构造方式，
+    见 linear / quadratic / hermite 三个类方法。
+
+    Attributes
+    ----------
+    breaks : ndarray, (n+1,)   分段点
+    c      : ndarray, (k+1, n) 各段系数，第 j 行为 t^j 的系数
+    """
+
+    def __init__(self, breaks: Sequence[float], c: np.ndarray) -> None:
+        self.breaks = np.asarray(breaks, dtype=float)
+        self.c = np.ascontiguousarray(c, dtype=float)
+        if self.c.ndim != 2 or self.c.shape[1] != self.breaks.size - 1:
+            raise ValueError("系数数组的形状应为 (k+1, 段数)")
+        if np.any(np.diff(self.breaks) <= 0):
+            raise ValueError("要求分段点严格递增")
+
+    @property
+    def degree(self) -> int:
+        return self.c.shape[0] - 1
+
+    @staticmethod
+    def _check(x, y, min_points):
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float)
+        if x.ndim != 1 or x.size < min_points:
+            raise ValueError(f"至少需要 {min_points} 个数据点")
+        if y.shape != x.shape:
+            raise ValueError("x 与 y 数组长度必须相等")
+        return x, y
+
+    @classmethod
+    def linear(cls, x: Sequence[float], y: Sequence[float]) -> "PiecewisePolynomial":
+        """分段线性插值：P_i(t) = y_i + (y_{i+1} - y_i) / h_i · t"""
+        x, y = cls._check(x, y, 2)
+        return cls(x, np.vstack([y[:-1], np.diff(y) / np.diff(x)]))
+
+    @classmethod
+    def quadratic(cls, x: Sequence[float], y: Sequence[float]) -> "PiecewisePolynomial":
+        """
+        分段二次插值：每相邻三个节点 x_{2j}, x_{2j+1}, x_{2j+2} 构成一段，
+        段上为过这三点的抛物线，因此要求节点数为奇数。
+        """
+        x, y = cls._check(x, y, 3)
+        if x.size % 2 == 0:
+            raise ValueError("分段二次插值要求节点数为奇数")
+        x0, x1, x2 = x[:-2:2], x[1:-1:2], x[2::2]
+        y0, y1, y2 = y[:-2:2], y[1:-1:2], y[2::2]
+        d1 = (y1 - y0) / (x1 - x0)                  # 一阶差商
+        d2 = ((y2 - y1) / (x2 - x1) - d1) / (x2 - x0)  # 二阶差商
+        # 牛顿形式 y0 + d1 t + d2 t (t - (x1 - x0)) 按 t 的幂次展开
+        return cls(x[::2], np.vstack([y0, d1 - d2 * (x1 - x0), d2]))
+
+    @classmethod
+    def hermite(cls, x: Sequence[float], y: Sequence[float],
+                dy: Sequence[float]) -> "PiecewisePolynomial":
+        """分段三次 Hermite 插值：每段两端同时插值函数值 y 与导数值 dy。"""
+        x, y = cls._check(x, y, 2)
+        dy = np.asarray(dy, dtype=float)
+        if dy.shape != x.shape:
+            raise ValueError("dy 与 x 数组长度必须相等")
+        h = np.diff(x)
+        slope = np.diff(y) / h
+        c2 = (3 * slope - 2 * dy[:-1] - dy[1:]) / h
+        c3 = (dy[:-1] + dy[1:] - 2 * slope) / h ** 2
+        return cls(x, np.vstack([y[:-1], dy[:-1], c2, c3]))
+
+    def interval_index(self, xq: np.ndarray) -> np.ndarray:
+        """每个查询点所在分段的编号，两端之外归入首/末段。"""
+        idx = np.searchsorted(self.breaks, xq, side='right') - 1
+        return np.clip(idx, 0, self.c.shape[1] - 1)
+
+    def __call__(self, xq, nu: int = 0, extrapolate: bool = True) -> np.ndarray:
+        """
+        计算 nu 阶导数 P^(nu)(xq)，xq 可为任意形状的数组。
+
+        extrapolate=False 时 [b_0, b_n] 之外返回 nan。
+        """
+        xq = np.asarray(xq, dtype=float)
+        i = self.interval_index(xq)
+        t = xq - self.breaks[i]
+        out = np.zeros(xq.shape)
+        # t^j 的系数 c[j+nu] (j+nu)!/j!，从高次到低次 Horner 累加
+        for j in range(self.degree - nu, -1, -1):
+            out = out * t + self.c[j + nu, i] * (factorial(j + nu) // factorial(j))
+        if not extrapolate:
+            out = np.where((xq < self.breaks[0]) | (xq > self.breaks[-1]), np.nan, out)
+        return out if out.ndim else float(out)
+
+
+# --------------------- DEMO ---------------------
+if __name__ == "__main__":
+    import time
+
+    # Runge 函数 1/(1+25x²)：高次多项式插值振荡，分段低次插值一致收敛
+    f = lambda x: 1 / (1 + 25 * x ** 2)
+    df = lambda x: -50 * x / (1 + 25 * x ** 2) ** 2
+    xq = np.linspace(-1, 1, 2001)
+    for n in (10, 20, 40):
+        x = np.linspace(-1, 1, n + 1)
+        errs = [np.max(np.abs(p(xq) - f(xq))) for p in (
+            PiecewisePolynomial.linear(x, f(x)),
+            PiecewisePolynomial.quadratic(x, f(x)),
+            PiecewisePolynomial.hermite(x, f(x), df(x)))]
+        print(f"n = {n:>2}：线性 {errs[0]:.2e}，二次 {errs[1]:.2e}，Hermite {errs[2]:.2e}")
+
+    # 10⁷ 个查询点一次求值
+    x = np.linspace(-1, 1, 10_001)
+    p = PiecewisePolynomial.hermite(x, f(x), df(x))
+    xq = np.random.default_rng(0).uniform(-1, 1, 10_000_000)
+    start = time.perf_counter()
+    p(xq)
+    print(f"Hermite，10⁴ 段、10⁷ 个查询点：{time.perf_counter() - start:.2f} s")
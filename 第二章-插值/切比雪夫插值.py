@@ -0,0 +1,128 @@
+import numpy as np
+
+
+def chebyshev_points(n, a=-1.0, b=1.0):
+    """[a, b] 上的 n+1 个切比雪夫极值点 x_j = cos(jπ/n)（从 b 到 a 排列）。"""
+    t = np.cos(np.pi * np.arange(n + 1) / n) if n else np.zeros(1)
+    return (a + b) / 2 + (b - a) / 2 * t
+
+
+def chebyshev_coefficients(values):
+    """
+    由切比雪夫极值点上的函数值求插值多项式的切比雪夫系数 c_0..c_n，
+
+        p(t) = Σ c_k T_k(t),
+
+    即第一类离散余弦变换 (DCT-I)。把 n+1 个值偶延拓为长 2n 的周期序列后
+    做一次实 FFT，O(n log n)，代替 O(n²) 的直接求和或解范德蒙德方程组。
+    """
+    v = np.asarray(values, dtype=float)
+    n = v.size - 1
+    if n == 0:
+        return v.copy()
+    c = np.fft.rfft(np.concatenate([v, v[-2:0:-1]])).real / n
+    c[0] /= 2
+    c[n] /= 2
+    return c
+
+
+class ChebyshevInterpolant:
+    """
+    [a, b] 上的切比雪夫插值多项式 p(x) = Σ c_k T_k(t)，t = (2x - a - b) / (b - a)。
+
+    fit 根据函数本身自动确定次数：在 n+1 个切比雪夫点上采样，
+    n 逐次加倍，直到尾部系数小于 tol（相对最大系数）为止，
+    再截去可忽略的尾部系数。加倍时旧节点恰好是新节点中的偶数号点，
+    只需在新增的 n 个点上调用 f。
+
+    Attributes
+    ----------
+    coeffs : ndarray   切比雪夫系数 c_0..c_n
+    a, b   : float     区间端点
+    n_evals : int      fit 时调用 f 的总点数
+    """
+
+    def __init__(self, coeffs, a=-1.0, b=1.0):
+        if not a < b:
+            raise ValueError("要求 a < b")
+        self.coeffs = np.asarray(coeffs, dtype=float)
+        self.a, self.b = float(a), float(b)
+        self.n_evals = 0
+
+    @property
+    def degree(self):
+        return self.coeffs.size - 1
+
+    @classmethod
+    def fit(cls, f, a=-1.0, b=1.0, tol=1e-13, n_min=16, n_max=2 ** 16):
+        """
+        自适应次数的切比雪夫插值。
+
+        f 应接受数组并逐元素返回函数值。若 n 超过 n_max 仍未收敛，
+        抛出 RuntimeError（函数可能不光滑或有奇点）。
+        """
+        def sample(x):
+            y = np.asarray(f(x), dtype=float)
+            return np.broadcast_to(y, x.shape)
+
+        n = max(int(n_min), 2)
+        values = sample(chebyshev_points(n, a, b))
+        n_evals = n + 1
+        while True:
+            c = chebyshev_coefficients(values)
+            scale = max(np.max(np.abs(c)), np.finfo(float).tiny)
+            tail = np.abs(c[-max(n // 8, 2):])
+            if np.max(tail) <= tol * scale:
+                keep = np.nonzero(np.abs(c) > tol * scale)[0]
+                p = cls(c[:keep[-1] + 1] if keep.size else c[:1], a, b)
+                p.n_evals = n_evals
+                return p
+            if 2 * n > n_max:
+                raise RuntimeError(f"n = {n_max} 时尾部系数仍为 {np.max(tail) / scale:.1e}，"
+                                   f"未达到 tol = {tol:.0e}")
+            # 2n 的极值点中，偶数号即原来的 n+1 个点，只需计算奇数号新点
+            new_x = chebyshev_points(2 * n, a, b)[1::2]
+            merged = np.empty(2 * n + 1)
+            merged[::2] = values
+            merged[1::2] = sample(new_x)
+            values, n = merged, 2 * n
+            n_evals += new_x.size
+
+    def __call__(self, x):
+        """Clenshaw 递推求值，x 可为标量或数组。"""
+        x = np.asarray(x, dtype=float)
+        t = (2 * x - self.a - self.b) / (self.b - self.a)
+        b1 = np.zeros(t.shape)
+        b2 = np.zeros(t.shape)
+        for c in self.coeffs[:0:-1]:
+            b1, b2 = 2 * t * b1 - b2 + c, b1
+        out = t * b1 - b2 + self.coeffs[0]
+        return out if out.ndim else float(out)
+
+
+# --------------------- DEMO ---------------------
+if __name__ == "__main__":
+    import time
+
+    xq = np.linspace(-1, 1, 10_001)
+    tests = (("exp(x)", np.exp),
+             ("1/(1+25x²)  (Runge)", lambda x: 1 / (1 + 25 * x ** 2)),
+             ("sin(40x)", lambda x: np.sin(40 * x)),
+             ("|x|³", lambda x: np.abs(x) ** 3))
+    print(f"{'f(x)':<22} | {'次数':>5} | {'f 调用点数':>9} | {'max 误差':>8} | {'耗时 ms':>7}")
+    print("-" * 66)
+    for name, f in tests:
+        start = time.perf_counter()
+        p = ChebyshevInterpolant.fit(f, -1, 1, tol=1e-13)
+        t_fit = time.perf_counter() - start
+        err = np.max(np.abs(p(xq) - f(xq)))
+        print(f"{name:<22} | {p.degree:>5} | {p.n_evals:>9} | {err:>8.1e} | {t_fit * 1e3:>7.2f}")
+
+    # 对比：等距节点高次插值的 Runge 现象
+    from 重心插值 import BarycentricInterpolator
+    runge = tests[1][1]
+    x_eq = np.linspace(-1, 1, 21)
+    print(f"\nRunge 函数 20 次插值：等距节点误差 "
+          f"{np.max(np.abs(BarycentricInterpolator(x_eq, runge(x_eq))(xq) - runge(xq))):.1e}，"
+          f"切比雪夫点误差 "
+          f"{np.max(np.abs(BarycentricInterpolator(chebyshev_points(20), runge(chebyshev_points(20)))(xq) - runge(xq))):.1e}")
@@ -0,0 +1,94 @@
+from collections import deque
+
+import numpy as np
+
+
+class IncrementalNewtonInterpolator:
+    """
+    流式牛顿插值：逐个追加样本，不重建差商表。
+
+    只保存差商表中以最新节点结尾的一条对角线
+        d_k = f[x_{m-k}, ..., x_m],  k = 0..m   (x_m 为最新节点)
+    对应以最新节点为起点的牛顿形式
+        N(x) = d_0 + d_1 (x - x_m) + d_2 (x - x_m)(x - x_{m-1}) + ...
+    追加节点 x_new 时由递推
+        d'_0 = f(x_new),  d'_k = (d'_{k-1} - d_{k-1}) / (x_new - x_{m+1-k})
+    得到新对角线，O(n)；删除最旧节点恰好是去掉最后一项 d_m，O(1)。
+
+    Parameters
+    ----------
+    window : int 或 None
+        滑动窗口大小；给定时始终只保留最近 window 个节点。
+    """
+
+    def __init__(self, window=None):
+        if window is not None and window < 1:
+            raise ValueError("window 至少为 1")
+        self.window = window
+        self._x = deque()          # 节点，最旧在左
+        self._d = []               # 对角线差商 d_0 .. d_m
+
+    def append(self, x_new, f_new):
+        """追加一个样本，O(n)；超出窗口时自动丢弃最旧节点。"""
+        x_new, f_new = float(x_new), float(f_new)
+        d_new = [f_new]
+        # x_{m+1-k} 依次为最新、次新 … 最旧节点
+        for k, x_k in enumerate(reversed(self._x), start=1):
+            if x_k == x_new:
+                raise ValueError(f"节点 {x_new} 已存在，插值节点必须互异")
+            d_new.append((d_new[k - 1] - self._d[k - 1]) / (x_new - x_k))
+        self._x.append(x_new)
+        self._d = d_new
+        if self.window is not None and len(self._x) > self.window:
+            self.pop_oldest()
+        return self
+
+    def extend(self, xs, fs):
+        for x_new, f_new in zip(xs, fs):
+            self.append(x_new, f_new)
+        return self
+
+    def pop_oldest(self):
+        """删除最旧节点，其余差商不变，O(1)。"""
+        if not self._x:
+            raise IndexError("没有可删除的节点")
+        self._d.pop()
+        return self._x.popleft()
+
+    @property
+    def nodes(self):
+        return np.array(self._x)
+
+    @property
+    def coefficients(self):
+        """牛顿系数 d_0..d_m（以最新节点为起点的顺序）。"""
+        return np.array(self._d)
+
+    def __call__(self, x_val):
+        """Horner 嵌套乘法求值，x_val 可为标量或数组。"""
+        if not self._d:
+            raise RuntimeError("尚未加入任何节点")
+        x_val = np.asarray(x_val, dtype=float)
+        newest_first = list(reversed(self._x))
+        p = np.full(x_val.shape, self._d[-1])
+        for k in range(len(self._d) - 2, -1, -1):
+            p = p * (x_val - newest_first[k]) + self._d[k]
+        return p if p.ndim else float(p)
+
+    def __len__(self):
+        return len(self._x)
+
+
+# --------------------- DEMO ---------------------
+if __name__ == "__main__":
+    # 与 4,牛顿差商生成器 示例相同：√x 在 100, 121, 144 处
+    p = IncrementalNewtonInterpolator().extend([100, 121, 144], [10, 11, 12])
+    print(f"N(115) = {p(115):.6f}, √115 = {np.sqrt(115):.6f}")
+
+    # 传感器流：窗口 4，每来一个样本 O(n) 更新
+    stream = IncrementalNewtonInterpolator(window=4)
+    for t in np.arange(0, 2.01, 0.25):
+        stream.append(t, np.sin(t))
+        if len(stream) == 4:
+            print(f"窗口节点 {stream.nodes}: N({t - 0.1:.2f}) = {stream(t - 0.1):.6f}, "
+                  f"sin = {np.sin(t - 0.1):.6f}")
@@ -0,0 +1,63 @@
+import time
+
+import numpy as np
+
+from 差分表 import DifferenceTable
+
+
+def legacy_forward_table(y, max_order):
+    """原 generate_forward_diff_table 的二重循环（截断到 max_order 阶）。"""
+    n = len(y)
+    diff_table = np.full((n, max_order + 1), np.nan)
+    diff_table[:, 0] = y
+    for j in range(1, max_order + 1):
+        for i in range(n - j):
+            diff_table[i, j] = diff_table[i + 1, j - 1] - diff_table[i, j - 1]
+    return diff_table
+
+
+def legacy_backward_table(y, max_order):
+    """原 generate_backward_diff_table 的二重循环（截断到 max_order 阶）。"""
+    n = len(y)
+    diff_table = np.full((n, max_order + 1), np.nan)
+    diff_table[:, 0] = y
+    for j in range(1, max_order + 1):
+        for i in range(n - 1, j - 1, -1):
+            diff_table[i, j] = diff_table[i, j - 1] - diff_table[i - 1, j - 1]
+    return diff_table
+
+
+if __name__ == "__main__":
+    # 10⁵ 个等距样本；全阶三角表需 5×10⁹ 个数，这里对比到 max_order 阶
+    n = 100_000
+    x = np.linspace(0, 1, n)
+    y = np.exp(x)
+
+    print(f"n = {n}")
+    print(f"{'阶数':>4} | {'二重循环(前+后) s':>17} | {'共享存储 s':>10} | "
+          f"{'加速比':>6} | {'内存 两张表 / 共享':>18}")
+    print("-" * 72)
+    for m in (4, 10, 20):
+        start = time.perf_counter()
+        F = legacy_forward_table(y, m)
+        B = legacy_backward_table(y, m)
+        t_legacy = time.perf_counter() - start
+
+        start = time.perf_counter()
+        table = DifferenceTable(y, max_order=m)
+        t_shared = time.perf_counter() - start
+
+        assert np.array_equal(F, table.forward_table(), equal_nan=True)
+        assert np.array_equal(B, table.backward_table(), equal_nan=True)
+        mem_legacy = (F.nbytes + B.nbytes) / 2 ** 20
+        mem_shared = table.buf.nbytes / 2 ** 20
+        print(f"{m:>4} | {t_legacy:>17.3f} | {t_shared:>10.4f} | "
+              f"{t_legacy / t_shared:>6.0f} | {mem_legacy:>8.1f} / {mem_shared:.1f} MiB")
+
+    # 前插、后插公式各取一行差分：只是对同一缓冲区的花式索引
+    i = n // 2
+    start = time.perf_counter()
+    for _ in range(10_000):
+        table.forward_row(i, 5)
+        table.backward_row(i, 5)
+    print(f"\n取差分行 (前插 + 后插)：{(time.perf_counter() - start) / 1e4 * 1e6:.1f} μs/次")
@@ -0,0 +1,79 @@
+import numpy as np
+
+
+class DifferenceTable:
+    """
+    等距节点的差分表，向前与向后差分共用同一块连续存储。
+
+    由 ∇^k f_i = Δ^k f_{i-k}，两种差分只是同一组数的不同下标：
+    第 k 阶向前差分 Δ^k f_0..Δ^k f_{n-1-k} 依次存放在一维数组 buf 的
+    [offsets[k], offsets[k+1]) 段中（共 n + (n-1) + ... 个数，三角形压缩存储），
+    每一阶由上一阶的相邻相减一次向量化得到，不再逐个元素二重循环。
+
+    Parameters
+    ----------
+    y : array_like, (n,)
+        等距节点上的函数值
+    max_order : int 或 None
+        最高差分阶数，默认 n-1；样本很多而只用低阶差分时可以截断，
+        存储从 O(n²) 降为 O(n · max_order)。
+    """
+
+    def __init__(self, y, max_order=None):
+        y = np.asarray(y, dtype=float).ravel()
+        n = y.size
+        if n == 0:
+            raise ValueError("至少需要一个数据点")
+        m = n - 1 if max_order is None else min(int(max_order), n - 1)
+        self.n, self.max_order = n, m
+
+        lengths = n - np.arange(m + 1)
+        self.offsets = np.concatenate(([0], np.cumsum(lengths)))
+        self.buf = np.empty(self.offsets[-1])
+        self.buf[:n] = y
+        for k in range(1, m + 1):
+            prev = self.order(k - 1)
+            np.subtract(prev[1:], prev[:-1], out=self.buf[self.offsets[k]:self.offsets[k + 1]])
+
+    def order(self, k):
+        """第 k 阶向前差分 Δ^k f_0..Δ^k f_{n-1-k}（buf 的视图，不复制）。"""
+        if not 0 <= k <= self.max_order:
+            raise IndexError(f"差分阶数应在 0..{self.max_order} 之间")
+        return self.buf[self.offsets[k]:self.offsets[k + 1]]
+
+    def forward_row(self, i, num):
+        """从节点 i 出发的 Δ^0 f_i .. Δ^{num-1} f_i（牛顿前插公式所需）。"""
+        k = np.arange(num)
+        if num - 1 > self.max_order or i < 0 or i + num > self.n:
+            raise IndexError("所需差分超出差分表范围")
+        return self.buf[self.offsets[k] + i]
+
+    def backward_row(self, i, num):
+        """到节点 i 为止的 ∇^0 f_i .. ∇^{num-1} f_i（牛顿后插公式所需）。"""
+        k = np.arange(num)
+        if num - 1 > self.max_order or i >= self.n or i - num + 1 < 0:
+            raise IndexError("所需差分超出差分表范围")
+        return self.buf[self.offsets[k] + i - k]
+
+    def forward_table(self):
+        """展开成 n × (max_order+1) 的向前差分表，空位为 nan（供打印）。"""
+        table = np.full((self.n, self.max_order + 1), np.nan)
+        for k in range(self.max_order + 1):
+            table[:self.n - k, k] = self.order(k)
+        return table
+
+    def backward_table(self):
+        """展开成 n × (max_order+1) 的向后差分表：第 k 列即同一段数据下移 k 行。"""
+        table = np.full((self.n, self.max_order + 1), np.nan)
+        for k in range(self.max_order + 1):
+            table[k:, k] = self.order(k)
+        return table
+
+
+# --------------------- DEMO ---------------------
+if __name__ == "__main__":
+    # 与 2,牛顿前插生成器 / 3,牛顿后插生成器 示例相同
+    table = DifferenceTable([1.0000, 1.2214, 1.4918, 1.8221, 2.2255])
+    print("buf =", np.round(table.buf, 4))
+    print("Δ^k f_0 =", np.round(table.forward_row(0, 4), 4))
+    print("∇^k f_4 =", np.round(table.backward_row(4, 3), 4))
@@ -0,0 +1,125 @@
+from collections import OrderedDict, namedtuple
+from threading import Lock
+
+import sympy as sp
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+
+class LambdifyCache:
+    """
+    sympy.lambdify 的 LRU 缓存。
+
+    lambdify 每次都要生成并编译一段 Python 源码，代价远大于一次数值求值；
+    同一表达式在绘图、代入计算、误差估计中被反复转换时，这部分开销占了
+    主要时间。sympy 表达式按结构哈希、按结构比较相等，因此以
+    (参数, 表达式, modules) 为键即可：结构相同的表达式共用一个数值函数。
+    modules 只有为字符串或字符串序列时才按值作键；含字典、模块对象等
+    不可按值比较的部分时不缓存，直接调用 sympy.lambdify。
+
+    Parameters
+    ----------
+    maxsize : int 或 None
+        最多缓存的函数个数，超出时淘汰最久未使用的；None 表示不限，0 表示不缓存。
+    """
+
+    def __init__(self, maxsize=128):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = Lock()
+        self.hits = self.misses = 0
+
+    @staticmethod
+    def _key(args, expr, modules):
+        """缓存键；modules 不是字符串或字符串序列时返回 None（不缓存）。"""
+        if not (isinstance(modules, str) or
+                isinstance(modules, (list, tuple)) and all(isinstance(m, str) for m in modules)):
+            return None
+
+        def freeze(obj):
+            if isinstance(obj, (list, tuple)):
+                return (type(obj).__name__,) + tuple(freeze(o) for o in obj)
+            return sp.sympify(obj) if not isinstance(obj, str) else obj
+        return freeze(args), freeze(expr), freeze(modules)
+
+    def lambdify(self, args, expr, modules='numpy'):
+        """与 sympy.lambdify(args, expr, modules) 相同，命中缓存时直接返回已编译的函数。"""
+        key = None if self.maxsize == 0 else self._key(args, expr, modules)
+        if key is None:
+            self.misses += 1
+            return sp.lambdify(args, expr, modules=modules)
+        with self._lock:
+            func = self._data.get(key)
+            if func is not None:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return func
+        func = sp.lambdify(args, expr, modules=modules)
+        with self._lock:
+            self.misses += 1
+            self._data[key] = func
+            self._evict()
+        return func
+
+    def _evict(self):
+        while self.maxsize is not None and len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def resize(self, maxsize):
+        """修改容量，立即淘汰多余的条目。"""
+        with self._lock:
+            self.maxsize = maxsize
+            self._evict()
+            if maxsize == 0:
+                self._data.clear()
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = 0
+
+    def cache_info(self):
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._data))
+
+
+# 进程内共用的一个缓存
+_cache = LambdifyCache()
+
+
+def cached_lambdify(args, expr, modules='numpy'):
+    """带进程级 LRU 缓存的 sympy.lambdify。"""
+    return _cache.lambdify(args, expr, modules)
+
+
+def configure_lambdify_cache(maxsize):
+    """设置进程级缓存的容量（None 为不限，0 为关闭缓存）。"""
+    _cache.resize(maxsize)
+
+
+def lambdify_cache_info():
+    return _cache.cache_info()
+
+
+def clear_lambdify_cache():
+    _cache.clear()
+
+
+# --------------------- DEMO ---------------------
+if __name__ == "__main__":
+    import time
+
+    import numpy as np
+
+    x = sp.symbols('x')
+    xs = np.linspace(0, 1, 101)
+    # 每次都重新构造表达式，结构相同即命中
+    start = time.perf_counter()
+    for k in range(200):
+        sp.lambdify(x, sp.expand((x - 1) ** 5 + sp.sin(x)), 'numpy')(xs)
+    t_plain = time.perf_counter() - start
+    start = time.perf_counter()
+    for k in range(200):
+        cached_lambdify(x, sp.expand((x - 1) ** 5 + sp.sin(x)))(xs)
+    t_cached = time.perf_counter() - start
+    print(f"200 次转换求值：lambdify {t_plain * 1e3:.1f} ms，缓存 {t_cached * 1e3:.1f} ms")
+    print(lambdify_cache_info())
@@ -1 +1,53 @@
-﻿
\ No newline at end of file
+﻿import os
+import sys
+
+import numpy as np
+
+# 分段多项式的系数构造与求值放在上一级目录的 分段多项式.py 中
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+from 分段多项式 import PiecewisePolynomial
+
+def format_segment(p, i):
+    """第 i 段多项式的LaTeX表达式（以 t = x - x_i 表示）"""
+    x0 = p.breaks[i]
+    shift = f"(x - {x0:.2f})" if x0 >= 0 else f"(x + {-x0:.2f})"
+    terms = [f"{p.c[0, i]:.4f}"]
+    for j in range(1, p.degree + 1):
+        coeff = p.c[j, i]
+        power = shift if j == 1 else f"{shift}^{j}"
+        terms.append(f"{'-' if coeff < 0 else '+'} {abs(coeff):.4f}{power}")
+    return " ".join(terms)
+
+def generate_latex_solution(x, p, title):
+    """生成分段插值的LaTeX解答过程"""
+    i = int(p.interval_index(x))
+    rows = [f"{format_segment(p, k)}, & x \\in [{p.breaks[k]:.2f}, {p.breaks[k + 1]:.2f}]"
+            for k in range(p.c.shape[1])]
+    cases = " \\\\\n".join(rows)
+    latex = f"""
+\\textbf{{{title}}}：
+\\[
+P(x) = \\begin{{cases}}
+{cases}
+\\end{{cases}}
+\\]
+\\(x = {x:.2f}\\) 位于第 {i + 1} 段 \\([{p.breaks[i]:.2f}, {p.breaks[i + 1]:.2f}]\\)：
+\\[
+P({x:.2f}) = {format_segment(p, i).replace('x', f'{x:.2f}')} \\approx {p(x):.6f}
+\\]
+"""
+    return latex
+
+##################### 主程序示例 #########################
+x_list = np.array([0.0, 0.2, 0.4, 0.6, 0.8])
+y_list = np.array([1.0000, 1.2214, 1.4918, 1.8221, 2.2255])
+dy_list = y_list.copy()  # f(x) = e^x，导数即函数值
+
+# 分段线性插值
+print(generate_latex_solution(0.12, PiecewisePolynomial.linear(x_list, y_list), "分段线性插值"))
+
+# 分段二次插值（每三个相邻节点一段）
+print(generate_latex_solution(0.12, PiecewisePolynomial.quadratic(x_list, y_list), "分段二次插值"))
+
+# 分段三次Hermite插值
+print(generate_latex_solution(0.12, PiecewisePolynomial.hermite(x_list, y_list, dy_list), "分段三次Hermite插值"))
\ No newline at end of file
@@ -0,0 +1,100 @@
+import numpy as np
+
+
+class NodeIndex:
+    """
+    插值节点的有序索引：排序一次，之后每次选点只做二分查找。
+
+    三种选点方式对应各插值生成器中的 select_nodes：
+      • nearest         距离 x 最近的 n 个节点（牛顿差商、拉格朗日）
+      • forward_window  以 x 左侧最近节点为起点的连续 n 个节点（牛顿前插）
+      • backward_window 以 x 右侧最近节点为终点的连续 n 个节点（牛顿后插）
+    最近的 n 个节点在有序数组中必为连续的一段，因此只需二分查找这一段的
+    起点，每次查询 O(log N + n)，无需对全部 N 个距离排序。
+    x 可以是标量，也可以是一批查询点（此时返回 (m, n) 的下标数组）。
+
+    返回的都是原数组 x_list 中的下标。
+    """
+
+    def __init__(self, x_list):
+        self.x_list = np.asarray(x_list, dtype=float).ravel()
+        self.order = np.argsort(self.x_list, kind='stable')
+        self.sorted_x = self.x_list[self.order]
+
+    def __len__(self):
+        return self.sorted_x.size
+
+    def _check(self, n_points):
+        if not 1 <= n_points <= len(self):
+            raise ValueError(f"节点数应在 1..{len(self)} 之间")
+
+    def _gather(self, start, n_points):
+        """由有序数组中的起点取连续 n_points 个节点的原下标。"""
+        return self.order[start[..., None] + np.arange(n_points)]
+
+    def nearest(self, x, n_points):
+        """
+        距离 x 最近的 n_points 个节点的原下标，按原数组顺序排列。
+
+        在起点区间 [idx - n, idx] 内二分：若 x - s[L] > s[L + n] - x，
+        说明左端比右侧下一个节点更远，窗口应右移。
+        """
+        self._check(n_points)
+        x = np.asarray(x, dtype=float)
+        N = len(self)
+        idx = np.searchsorted(self.sorted_x, x)
+        lo = np.clip(idx - n_points, 0, N - n_points)
+        hi = np.clip(idx, 0, N - n_points)
+        while np.any(lo < hi):
+            mid = (lo + hi) // 2
+            move_right = x - self.sorted_x[mid] > self.sorted_x[np.minimum(mid + n_points, N - 1)] - x
+            lo = np.where((lo < hi) & move_right, mid + 1, lo)
+            hi = np.where((lo < hi) & ~move_right, mid, hi)
+        return np.sort(self._gather(lo, n_points), axis=-1)
+
+    def forward_window(self, x, n_points):
+        """以 x 左侧最近节点为起点的连续 n_points 个节点（越界时贴住端点）。"""
+        self._check(n_points)
+        idx = np.searchsorted(self.sorted_x, x)
+        start = np.clip(idx - 1, 0, len(self) - n_points)
+        return self._gather(start, n_points)
+
+    def backward_window(self, x, n_points):
+        """以 x 右侧最近节点为终点的连续 n_points 个节点（越界时贴住端点）。"""
+        self._check(n_points)
+        idx = np.searchsorted(self.sorted_x, x)
+        end = np.clip(idx, n_points - 1, len(self) - 1)
+        return self._gather(end - n_points + 1, n_points)
+
+
+# --------------------- DEMO ---------------------
+if __name__ == "__main__":
+    import time
+
+    index = NodeIndex([0.0, 0.2, 0.4, 0.6, 0.8])
+    print("nearest(0.12, 3)         =", index.nearest(0.12, 3))
+    print("forward_window(0.12, 4)  =", index.forward_window(0.12, 4))
+    print("backward_window(0.7, 3)  =", index.backward_window(0.7, 3))
+    print("批量 nearest([0.05, 0.5, 0.9], 2) =\n", index.nearest([0.05, 0.5, 0.9], 2))
+
+    # 10⁶ 个乱序节点、10⁵ 个查询点：逐个对距离排序 vs 一次批量二分
+    rng = np.random.default_rng(0)
+    xs = rng.random(1_000_000)
+    queries = rng.random(100_000)
+    start = time.perf_counter()
+    for q in queries[:100]:
+        np.sort(np.argsort(np.abs(xs - q))[:5])
+    t_sort = (time.perf_counter() - start) / 100
+    start = time.perf_counter()
+    index = NodeIndex(xs)
+    t_build = time.perf_counter() - start
+    start = time.perf_counter()
+    result = index.nearest(queries, 5)
+    t_batch = (time.perf_counter() - start) / queries.size
+    assert np.array_equal(result[0], np.sort(np.argsort(np.abs(xs - queries[0]))[:5]))
+    start = time.perf_counter()
+    for q in queries[:1000]:
+        index.nearest(q, 5)
+    t_single = (time.perf_counter() - start) / 1000
+    print(f"N = 10⁶：距离排序 {t_sort * 1e3:.1f} ms/次，建索引 {t_build:.2f} s，"
+          f"单次查询 {t_single * 1e6:.1f} μs/次，批量查询 {t_batch * 1e6:.2f} μs/次")
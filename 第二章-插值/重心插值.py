@@ -0,0 +1,77 @@
+import numpy as np
+
+
+class BarycentricInterpolator:
+    """
+    重心形式的拉格朗日插值（第二重心公式）
+
+        P(x) = Σ w_j y_j / (x - x_j)  /  Σ w_j / (x - x_j),
+        w_j  = 1 / Π_{k≠j} (x_j - x_k)
+
+    与展开成幂函数多项式相比，数值稳定，且：
+      • 新增一个节点只需 O(n) 更新权重；
+      • 每个查询点求值 O(n)，查询可以是任意形状的数组。
+
+    Attributes
+    ----------
+    x, y : ndarray   节点与函数值
+    w    : ndarray   重心权重
+    """
+
+    def __init__(self, x=(), y=()):
+        self.x = np.empty(0)
+        self.y = np.empty(0)
+        self.w = np.empty(0)
+        x = np.asarray(x, dtype=float).ravel()
+        y = np.asarray(y, dtype=float).ravel()
+        if x.size != y.size:
+            raise ValueError("x 与 y 数组长度必须相等")
+        for xi, yi in zip(x, y):
+            self.add_node(xi, yi)
+
+    def add_node(self, x_new, y_new):
+        """加入一个节点，已有权重各除以 (x_j - x_new)，O(n)。"""
+        diff = self.x - x_new
+        if np.any(diff == 0):
+            raise ValueError(f"节点 {x_new} 已存在，插值节点必须互异")
+        self.w = np.append(self.w / diff, 1.0 / np.prod(-diff))
+        self.x = np.append(self.x, float(x_new))
+        self.y = np.append(self.y, float(y_new))
+        return self
+
+    def __call__(self, x_val):
+        """对标量或数组求插值，返回形状与 x_val 相同。"""
+        if self.x.size == 0:
+            raise RuntimeError("尚未加入任何节点")
+        xq = np.asarray(x_val, dtype=float)
+        flat = xq.reshape(-1, 1)
+        diff = flat - self.x
+        exact = diff == 0
+        with np.errstate(divide='ignore', invalid='ignore'):
+            c = self.w / diff
+            result = (c @ self.y) / c.sum(axis=1)
+
+        # 查询点恰为节点时直接取节点值
+        hit = exact.any(axis=1)
+        if hit.any():
+            result[hit] = self.y[np.argmax(exact[hit], axis=1)]
+        return result.reshape(xq.shape) if xq.ndim else float(result[0])
+
+    def __len__(self):
+        return self.x.size
+
+
+# --------------------- DEMO ---------------------
+if __name__ == "__main__":
+    # 与 1,拉格朗日插值生成器 示例相同：ln(x) 在 10, 11, 12 处的 3 点插值
+    p = BarycentricInterpolator([11, 12, 10], [2.3979, 2.4849, 2.3026])
+    print(f"P(11.75) = {p(11.75):.6f}")
+
+    # 逐个追加节点，每次 O(n)
+    p.add_node(13, 2.5649)
+    print(f"加入 x=13 后 P(11.75) = {p(11.75):.6f}")
+
+    # 向量化求值
+    xs = np.linspace(10, 13, 7)
+    print("P(xs) =", np.round(p(xs), 6))
+    print("ln(xs) =", np.round(np.log(xs), 6))
@@ -0,0 +1,46 @@
+import time
+
+import numpy as np
+
+from SOR方法 import sor_sweep
+from 稀疏矩阵 import CSRMatrix
+
+
+def sor_sweep_loop(A, b, x, omega):
+    """原 sor() 中的逐元素生成器写法，仅作对照。"""
+    n = len(b)
+    x_old = x.copy()
+    for i in range(n):
+        sigma = sum(A[i, j] * (x[j] if j < i else x_old[j])
+                    for j in range(n) if j != i)
+        x[i] = (1 - omega) * x_old[i] + omega * (b[i] - sigma) / A[i, i]
+    return x
+
+
+def time_sweeps(sweep, A, b, omega, repeat):
+    x = np.zeros(len(b))
+    start = time.perf_counter()
+    for _ in range(repeat):
+        sweep(A, b, x, omega)
+    return (time.perf_counter() - start) / repeat, x
+
+
+if __name__ == "__main__":
+    omega = 1.1
+    grids = {100: (10, 10), 1000: (25, 40), 5000: (50, 100)}
+
+    print(f"{'n':>6} | {'逐元素循环 s/次':>16} | {'行点积 s/次':>14} | "
+          f"{'CSR s/次':>10} | {'加速比':>8} | 最大差值")
+    print("-" * 84)
+    for n, (nx, ny) in grids.items():
+        A_csr = CSRMatrix.poisson_5pt(nx, ny)
+        A = A_csr.toarray()
+        b = np.ones(n)
+        # 原写法在 n=5000 时单次扫描即需数十秒，只测 1 次
+        repeat = 3 if n <= 1000 else 1
+        t_loop, x_loop = time_sweeps(sor_sweep_loop, A, b, omega, repeat)
+        t_vec, x_vec = time_sweeps(sor_sweep, A, b, omega, repeat)
+        t_csr, x_csr = time_sweeps(sor_sweep, A_csr, b, omega, repeat)
+        diff = max(np.max(np.abs(x_loop - x_vec)), np.max(np.abs(x_loop - x_csr)))
+        print(f"{n:>6} | {t_loop:>16.4f} | {t_vec:>14.4f} | {t_csr:>10.4f} | "
+              f"{t_loop / t_vec:>8.1f} | {diff:.2e}")
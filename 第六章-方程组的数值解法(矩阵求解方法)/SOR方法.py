@@ -1,5 +1,8 @@
 import numpy as np
 
+from 稀疏矩阵 import CSRMatrix
+from 谱半径估计 import jacobi_spectral_radius
+
 # 定义线性系统 Ax = b
 A = np.array([
     [4, -1, 0, -1, 0, 0],
@@ -12,20 +15,68 @@ A = np.array([
 
 b = np.array([2, 3, 2, 2, 1, 2], dtype=float)
 
-def sor(A, b, omega, tol=1e-10, max_iter=10_000):
+def sor_sweep(A, b, x, omega, diag=None):
     """
-    使用逐次超松弛法 (SOR) 求解 Ax = b。
+    原地执行一次 SOR 行扫描。
+
+    第 i 行的求和项拆成两段点积：A[i, :i] @ x[:i] 使用本轮已更新的分量，
+    A[i, i+1:] @ x[i+1:] 使用尚未更新的旧分量。
+    每行只有一次 NumPy 调用，不再逐个 j 做 Python 循环。
 
     参数
     ----------
-    A : ndarray, shape (n, n)
+    A : ndarray 或 CSRMatrix, shape (n, n)
+        CSRMatrix 时改用其 sor_sweep，只访问非零元。
     b : ndarray, shape (n,)
+    x : ndarray, shape (n,)
+        当前迭代向量，就地更新。
     omega : float
+        松弛参数。
+    diag : ndarray, shape (n,), 可选
+        A 的对角元，多次扫描时可预先取出复用。
+
+    返回
+    -------
+    x : ndarray
+        更新后的迭代向量（与传入的 x 为同一对象）。
+    """
+    if isinstance(A, CSRMatrix):
+        return A.sor_sweep(b, x, omega, diag)
+    if diag is None:
+        diag = np.diag(A)
+    for i in range(len(b)):
+        sigma = A[i, :i] @ x[:i] + A[i, i + 1:] @ x[i + 1:]
+        x[i] = (1 - omega) * x[i] + omega * (b[i] - sigma) / diag[i]
+    return x
+
+
+def optimal_omega(rho_J):
+    """
+    由 Jacobi 迭代阵的谱半径 ρ_J 给出最优松弛因子
+    ω_opt = 2 / (1 + √(1 − ρ_J²))（对五点差分阵等相容次序矩阵成立）。
+    """
+    rho_J = min(rho_J, 1 - 1e-12)
+    return 2.0 / (1.0 + np.sqrt(1.0 - rho_J ** 2))
+
+
+def sor(A, b, omega, tol=1e-10, max_iter=10_000, verbose=False):
+    """
+    使用逐次超松弛法 (SOR) 求解 Ax = b。
+
+    参数
+    ----------
+    A : ndarray 或 CSRMatrix, shape (n, n)
+    b : ndarray, shape (n,)
+    omega : float 或 "auto"
         松弛参数 (omega = 1 → 高斯-赛德尔法)。
+        "auto" 时先用 Arnoldi 估计 ρ_J 取 ω_opt，迭代中再根据
+        相邻两步更新量之比 r 反推 ρ_J 并上调 ω（见 _observed_rho_J）。
     tol : float, 可选
         更新无穷范数的收敛阈值。
     max_iter : int, 可选
         迭代次数的安全上限。
+    verbose : bool, 可选
+        "auto" 模式下打印每次 ω 的调整。
 
     返回
     -------
@@ -34,36 +85,96 @@ def sor(A, b, omega, tol=1e-10, max_iter=10_000):
     k : int
         执行的迭代次数。
     """
+    if isinstance(A, CSRMatrix):
+        diag = A.diagonal()
+    else:
+        A = np.asarray(A, dtype=float)
+        diag = np.diag(A).copy()
+    b = np.asarray(b, dtype=float)
     n = len(b)
     x = np.zeros(n)
 
+    adaptive = isinstance(omega, str)
+    if adaptive:
+        if omega != "auto":
+            raise ValueError("omega 只能是数值或 \"auto\"")
+        # Arnoldi 估计通常偏小，得到的 ω 只会偏保守，由迭代中的观测值修正
+        rho_J = min(jacobi_spectral_radius(A), 1 - 1e-12)
+        omega = optimal_omega(rho_J)
+        if verbose:
+            print(f"初始估计 ρ_J ≈ {rho_J:.6f}, omega = {omega:.6f}")
+    delta_prev = ratio_prev = None
+
     for k in range(1, max_iter + 1):
         x_old = x.copy()
-
-        for i in range(n):
-            # 使用最新的值计算求和项
-            sigma = sum(A[i, j] * (x[j] if j < i else x_old[j])
-                        for j in range(n) if j != i)
-            x[i] = (1 - omega) * x_old[i] + omega * (b[i] - sigma) / A[i, i]
+        sor_sweep(A, b, x, omega, diag)
 
         if np.linalg.norm(x - x_old, ord=np.inf) < tol:
             return x, k
 
+        if not adaptive:
+            continue
+        delta = np.linalg.norm(x - x_old)
+        if delta_prev is not None:
+            ratio = delta / delta_prev
+            rho_obs = _observed_rho_J(ratio, ratio_prev, omega)
+            if rho_obs is not None and rho_obs > rho_J:
+                rho_J = min(rho_obs, 1 - 1e-12)
+                omega = optimal_omega(rho_J)
+                ratio = None          # 换了 ω 后重新等待收缩比稳定
+                if verbose:
+                    print(f"第 {k} 步: ρ_J ≈ {rho_J:.6f}, omega → {omega:.6f}")
+            ratio_prev = ratio
+        delta_prev = delta
+
     raise RuntimeError("SOR 在最大迭代次数内未收敛。")
 
-# 对 omega = 1.0 (高斯-赛德尔法) 和 omega = 1.1 运行 SOR
-results = {}
-for omega in (1.0, 1.1):
-    x, k = sor(A, b, omega)
-    residual = np.linalg.norm(A @ x - b, ord=np.inf)
-    results[omega] = (x, k, residual)
-
-# 显示结果
-for omega, (x, k, res) in results.items():
-    print(f"omega = {omega:.1f}")
-    print(f"收敛所需的迭代次数: {k}")
-    print("解向量:")
-    for i, xi in enumerate(x, start=1):
-        print(f"  x{i} = {xi:.10f}")
-    print(f"残差的无穷范数 ‖Ax − b‖_infty = {res:.3e}")
-    print("-" * 40)
+def _observed_rho_J(ratio, ratio_prev, omega, stable=1e-3):
+    """
+    由 SOR 的收缩比反推 ρ_J；收缩比尚未稳定时返回 None。
+
+    ω ≤ ω_opt 时 SOR 的主特征值 λ 满足 (λ + ω − 1)² = λ ω² ρ_J²，
+    稳定后的更新量之比 r ≈ λ，故 ρ_J ≈ (r + ω − 1) / (ω √r)。
+    r ≤ ω − 1 说明 ω 已达到或超过最优值，不再调整。
+    """
+    if ratio_prev is None or not (omega - 1 < ratio < 1):
+        return None
+    if abs(ratio - ratio_prev) >= stable * (1 - ratio):
+        return None
+    return (ratio + omega - 1) / (omega * np.sqrt(ratio))
+
+
+if __name__ == "__main__":
+    # 对 omega = 1.0 (高斯-赛德尔法) 和 omega = 1.1 运行 SOR
+    results = {}
+    for omega in (1.0, 1.1):
+        x, k = sor(A, b, omega)
+        residual = np.linalg.norm(A @ x - b, ord=np.inf)
+        results[omega] = (x, k, residual)
+
+    # 显示结果
+    for omega, (x, k, res) in results.items():
+        print(f"omega = {omega:.1f}")
+        print(f"收敛所需的迭代次数: {k}")
+        print("解向量:")
+        for i, xi in enumerate(x, start=1):
+            print(f"  x{i} = {xi:.10f}")
+        print(f"残差的无穷范数 ‖Ax − b‖_infty = {res:.3e}")
+        print("-" * 40)
+
+    # 同一方程组改用 CSR 稀疏存储求解
+    x_csr, k_csr = sor(CSRMatrix.from_dense(A), b, 1.1)
+    print(f"CSR 存储, omega = 1.1: 迭代 {k_csr} 次, "
+          f"与稠密结果最大差 {np.max(np.abs(x_csr - results[1.1][0])):.1e}")
+
+    # omega = "auto"：估计 ρ_J 取最优松弛因子，并在迭代中自适应调整
+    x_auto, k_auto = sor(A, b, "auto", verbose=True)
+    print(f"omega = auto: 迭代 {k_auto} 次, "
+          f"残差 {np.linalg.norm(A @ x_auto - b, ord=np.inf):.3e}")
+
+    # 30×30 网格的五点差分阵上比较固定 omega 与自动 omega
+    A_grid = CSRMatrix.poisson_5pt(30, 30)
+    b_grid = np.ones(A_grid.shape[0])
+    for omega in (1.0, 1.5, "auto"):
+        _, k = sor(A_grid, b_grid, omega, tol=1e-8)
+        print(f"30×30 网格, omega = {omega}: 迭代 {k} 次")
@@ -0,0 +1,63 @@
+import time
+
+import numpy as np
+
+from 三角分解求解器 import (CholeskyFactorization, LDLFactorization,
+                            LUFactorization, crout_lu_blocked, doolittle_lu,
+                            doolittle_lu_blocked)
+
+
+def throughput(solver, B, k):
+    """返回 (逐个求解 k 个右端项的耗时, 一次块求解的耗时)。"""
+    start = time.perf_counter()
+    for j in range(k):
+        solver.solve(B[:, j])
+    t_single = time.perf_counter() - start
+
+    start = time.perf_counter()
+    solver.solve(B)
+    t_block = time.perf_counter() - start
+    return t_single, t_block
+
+
+if __name__ == "__main__":
+    n, k = 300, 1000
+    rng = np.random.default_rng(0)
+    M = rng.standard_normal((n, n))
+    A = M @ M.T + n * np.eye(n)          # 对称正定，三种分解都适用
+    B = rng.standard_normal((n, k))
+
+    print(f"n = {n}, 右端项 k = {k}")
+    print(f"{'分解':<20} | {'分解 s':>8} | {'k=1 逐个 列/s':>14} | "
+          f"{'k=1000 块 列/s':>15} | {'加速比':>6}")
+    print("-" * 78)
+    for name, make in (("LU(doolittle)", lambda: LUFactorization(A)),
+                       ("LU(crout)", lambda: LUFactorization(A, method="crout")),
+                       ("LDLᵀ", lambda: LDLFactorization(A)),
+                       ("Cholesky", lambda: CholeskyFactorization(A))):
+        start = time.perf_counter()
+        solver = make()
+        t_factor = time.perf_counter() - start
+
+        t_single, t_block = throughput(solver, B, k)
+        print(f"{name:<20} | {t_factor:>8.4f} | {k / t_single:>14.0f} | "
+              f"{k / t_block:>15.0f} | {t_single / t_block:>6.1f}")
+
+        X = solver.solve(B)
+        assert np.allclose(A @ X, B), name
+
+    # 分解内核：逐行点积 vs 分块右视秩-k 更新
+    print(f"\n{'n':>6} | {'逐行点积 s':>10} | {'分块 s':>8} | max|LU - A| | Crout 分块 max|LU - A|")
+    print("-" * 74)
+    for n in (500, 2000, 4000):
+        A = rng.standard_normal((n, n)) + n * np.eye(n)
+        start = time.perf_counter()
+        doolittle_lu(A)
+        t_row = time.perf_counter() - start
+        start = time.perf_counter()
+        L, U = doolittle_lu_blocked(A)
+        t_blocked = time.perf_counter() - start
+        residual = np.max(np.abs(L @ U - A))
+        L, U = crout_lu_blocked(A)
+        print(f"{n:>6} | {t_row:>10.3f} | {t_blocked:>8.3f} | {residual:>11.1e} | "
+              f"{np.max(np.abs(L @ U - A)):.1e}")
@@ -0,0 +1,213 @@
+from abc import ABC, abstractmethod
+from typing import Literal
+
+import numpy as np
+
+
+def forward_substitution(L: np.ndarray, B: np.ndarray,
+                         unit_diagonal: bool = False) -> np.ndarray:
+    """
+    前代求解下三角方程组 L Y = B。
+
+    B 可以是 (n,) 向量或 (n, k) 的右端项块；第 i 步用一次点积
+    L[i, :i] @ Y[:i] 同时处理全部 k 列，只有 n 次 Python 循环。
+    """
+    Y = np.array(B, dtype=float)
+    for i in range(L.shape[0]):
+        if i:
+            Y[i] -= L[i, :i] @ Y[:i]
+        if not unit_diagonal:
+            Y[i] /= L[i, i]
+    return Y
+
+
+def back_substitution(U: np.ndarray, B: np.ndarray,
+                      unit_diagonal: bool = False) -> np.ndarray:
+    """回代求解上三角方程组 U X = B，B 的形状同 forward_substitution。"""
+    X = np.array(B, dtype=float)
+    n = U.shape[0]
+    for i in range(n - 1, -1, -1):
+        if i < n - 1:
+            X[i] -= U[i, i + 1:] @ X[i + 1:]
+        if not unit_diagonal:
+            X[i] /= U[i, i]
+    return X
+
+
+def doolittle_lu(A: np.ndarray):
+    """杜立特尔分解 A = LU（L 单位下三角），逐行用点积计算，不打印过程。"""
+    A = np.asarray(A, dtype=float)
+    n = A.shape[0]
+    L = np.eye(n)
+    U = np.zeros((n, n))
+    for i in range(n):
+        U[i, i:] = A[i, i:] - L[i, :i] @ U[:i, i:]
+        if U[i, i] == 0:
+            raise ZeroDivisionError(f"第 {i + 1} 步主元为零，无法继续分解")
+        L[i + 1:, i] = (A[i + 1:, i] - L[i + 1:, :i] @ U[:i, i]) / U[i, i]
+    return L, U
+
+
+def crout_lu(A: np.ndarray):
+    """克劳特分解 A = LU（U 单位上三角），逐列用点积计算，不打印过程。"""
+    A = np.asarray(A, dtype=float)
+    n = A.shape[0]
+    L = np.zeros((n, n))
+    U = np.eye(n)
+    for j in range(n):
+        L[j:, j] = A[j:, j] - L[j:, :j] @ U[:j, j]
+        if L[j, j] == 0:
+            raise ZeroDivisionError(f"第 {j + 1} 步主元为零，无法继续分解")
+        U[j, j + 1:] = (A[j, j + 1:] - L[j, :j] @ U[:j, j + 1:]) / L[j, j]
+    return L, U
+
+
+def doolittle_lu_blocked(A: np.ndarray, block_size: int = 64):
+    """
+    分块右视 (right-looking) 杜立特尔分解，结果与 doolittle_lu 布局相同：
+    L 单位下三角、U 上三角。
+
+    每次处理 block_size 列：先在列块 (panel) 内做秩 1 更新得到 L11、L21，
+    再由 L11 U12 = A12 前代求出 U12，最后用一次矩阵乘法
+    A22 -= L21 @ U12 完成秩 block_size 的尾部更新。O(n³) 的运算几乎
+    全部落在矩阵乘法上，n = 4000 只需数秒。
+    """
+    W = np.array(A, dtype=float)
+    n = W.shape[0]
+    for k0 in range(0, n, block_size):
+        k1 = min(k0 + block_size, n)
+
+        # 列块内的非分块消元
+        for j in range(k0, k1):
+            if W[j, j] == 0:
+                raise ZeroDivisionError(f"第 {j + 1} 步主元为零，无法继续分解")
+            W[j + 1:, j] /= W[j, j]
+            W[j + 1:, j + 1:k1] -= np.outer(W[j + 1:, j], W[j, j + 1:k1])
+
+        if k1 < n:
+            W[k0:k1, k1:] = forward_substitution(W[k0:k1, k0:k1], W[k0:k1, k1:],
+                                                 unit_diagonal=True)
+            W[k1:, k1:] -= W[k1:, k0:k1] @ W[k0:k1, k1:]
+
+    L = np.tril(W, -1) + np.eye(n)
+    U = np.triu(W)
+    return L, U
+
+
+def crout_lu_blocked(A: np.ndarray, block_size: int = 64):
+    """
+    分块克劳特分解（L 下三角、U 单位上三角），与 crout_lu 布局相同。
+
+    对 Aᵀ 做杜立特尔分解 Aᵀ = L'U'，则 A = U'ᵀ L'ᵀ，
+    其中 U'ᵀ 为下三角、L'ᵀ 为单位上三角，正是克劳特形式。
+    """
+    Lt, Ut = doolittle_lu_blocked(np.asarray(A, dtype=float).T, block_size)
+    return Ut.T.copy(), Lt.T.copy()
+
+
+def ldl_decomposition(A: np.ndarray):
+    """对称矩阵的 LDLᵀ 分解，返回单位下三角 L 与对角元数组 d。"""
+    A = np.asarray(A, dtype=float)
+    n = A.shape[0]
+    L = np.eye(n)
+    d = np.zeros(n)
+    for j in range(n):
+        d[j] = A[j, j] - (L[j, :j] ** 2) @ d[:j]
+        if d[j] == 0:
+            raise ZeroDivisionError(f"第 {j + 1} 步主元为零，无法继续分解")
+        L[j + 1:, j] = (A[j + 1:, j] - L[j + 1:, :j] @ (d[:j] * L[j, :j])) / d[j]
+    return L, d
+
+
+class _Factorization(ABC):
+    """分解一次、多次求解的公共部分：缓存因子，solve 接受 (n,) 或 (n, k) 右端项。"""
+
+    def __init__(self, A):
+        A = np.asarray(A, dtype=float)
+        if A.ndim != 2 or A.shape[0] != A.shape[1]:
+            raise ValueError("A 必须是方阵")
+        self.n = A.shape[0]
+        self._factor(A)
+
+    @abstractmethod
+    def _factor(self, A):
+        """分解方阵 A 并缓存因子。"""
+
+    @abstractmethod
+    def _solve(self, B):
+        """用缓存的因子求解，B 已检查过形状。"""
+
+    def solve(self, B) -> np.ndarray:
+        """
+        求解 AX = B。
+
+        B 为 (n,) 时返回 (n,)；为 (n, k) 时 k 个右端项在同一次
+        前代/回代中向量化求解，返回 (n, k)。
+        """
+        B = np.asarray(B, dtype=float)
+        if B.shape[0] != self.n or B.ndim > 2:
+            raise ValueError(f"右端项的形状应为 ({self.n},) 或 ({self.n}, k)")
+        return self._solve(B)
+
+
+class LUFactorization(_Factorization):
+    """LU 分解求解器，method 为 "doolittle"（L 单位下三角）或 "crout"（U 单位上三角）"""
+
+    def __init__(self, A, method: Literal["doolittle", "crout"] = "doolittle",
+                 block_size: int = 64):
+        if method not in ("doolittle", "crout"):
+            raise ValueError("method 只能是 \"doolittle\" 或 \"crout\"")
+        self.method = method
+        self.block_size = block_size
+        super().__init__(A)
+
+    def _factor(self, A):
+        if self.method == "doolittle":
+            self.L, self.U = doolittle_lu_blocked(A, self.block_size)
+        else:
+            self.L, self.U = crout_lu_blocked(A, self.block_size)
+
+    def _solve(self, B):
+        Y = forward_substitution(self.L, B, unit_diagonal=self.method == "doolittle")
+        return back_substitution(self.U, Y, unit_diagonal=self.method == "crout")
+
+
+class LDLFactorization(_Factorization):
+    """对称矩阵的 LDLᵀ 分解求解器：L Y = B，D Z = Y，Lᵀ X = Z"""
+
+    def _factor(self, A):
+        self.L, self.d = ldl_decomposition(A)
+
+    def _solve(self, B):
+        Y = forward_substitution(self.L, B, unit_diagonal=True)
+        Z = Y / (self.d if Y.ndim == 1 else self.d[:, None])
+        return back_substitution(self.L.T, Z, unit_diagonal=True)
+
+
+class CholeskyFactorization(_Factorization):
+    """对称正定矩阵的平方根法 (A = L Lᵀ) 求解器"""
+
+    def _factor(self, A):
+        self.L = np.linalg.cholesky(A)
+
+    def _solve(self, B):
+        Y = forward_substitution(self.L, B)
+        return back_substitution(self.L.T, Y)
+
+
+# --------------------- DEMO ---------------------
+if __name__ == "__main__":
+    # 平方根法(数值).py 中的方程组
+    A = np.array([[4, 2, -2],
+                  [2, 2, -3],
+                  [-2, -3, 14]], dtype=float)
+    b = np.array([10, 5, 4], dtype=float)
+
+    # 同一个 A，三个右端项一次求解
+    B = np.column_stack([b, 2 * b, np.ones(3)])
+    for solver in (LUFactorization(A), LUFactorization(A, method="crout"),
+                   LDLFactorization(A), CholeskyFactorization(A)):
+        name = type(solver).__name__ + (f"({solver.method})" if hasattr(solver, "method") else "")
+        X = solver.solve(B)
+        print(f"{name}: x = {solver.solve(b)}, "
+              f"块求解残差 {np.max(np.abs(A @ X - B)):.1e}")
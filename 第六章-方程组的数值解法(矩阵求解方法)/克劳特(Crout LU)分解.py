@@ -1,6 +1,12 @@
 import numpy as np
 
-def crout_decomposition(A):
+from 三角分解求解器 import crout_lu_blocked
+
+def crout_decomposition(A, verbose=True):
+    # verbose=False 时不打印过程，改用分块向量化引擎（L、U 布局相同）
+    if not verbose:
+        return crout_lu_blocked(A)
+
     n = len(A)
     L = np.zeros((n, n))  # 下三角矩阵
     U = np.eye(n)         # 单位上三角矩阵
@@ -1,6 +1,12 @@
 import numpy as np
 
-def doolittle_decomposition(A):
+from 三角分解求解器 import doolittle_lu_blocked
+
+def doolittle_decomposition(A, verbose=True):
+    # verbose=False 时不打印过程，改用分块向量化引擎（L、U 布局相同）
+    if not verbose:
+        return doolittle_lu_blocked(A)
+
     n = len(A)
     L = np.eye(n)  # 初始化 L 为单位下三角矩阵
     U = np.zeros((n, n))  # 初始化 U 为零矩阵
@@ -0,0 +1,146 @@
+import numpy as np
+
+
+class CSRMatrix:
+    """
+    压缩行存储 (CSR) 的稀疏方阵，供各迭代法共用。
+
+    第 i 行的非零元为 data[indptr[i]:indptr[i+1]]，
+    对应列号为 indices[indptr[i]:indptr[i+1]]。
+    存储量与一次扫描的计算量均为 O(nnz)，而不是稠密矩阵的 O(n²)。
+
+    参数
+    ----------
+    data : ndarray, shape (nnz,)
+    indices : ndarray, shape (nnz,)
+    indptr : ndarray, shape (n+1,)
+    shape : (int, int)
+    """
+
+    def __init__(self, data, indices, indptr, shape):
+        self.data = np.asarray(data, dtype=float)
+        self.indices = np.asarray(indices, dtype=np.intp)
+        self.indptr = np.asarray(indptr, dtype=np.intp)
+        self.shape = tuple(shape)
+        if self.indptr.size != self.shape[0] + 1:
+            raise ValueError("indptr 的长度必须为行数 + 1")
+        if self.data.size != self.indices.size:
+            raise ValueError("data 与 indices 的长度必须相同")
+        self._rows = None
+        self._diag = None
+
+    # --------------------- 构造 ---------------------
+    @classmethod
+    def from_dense(cls, A):
+        """由稠密矩阵构造，只保留非零元。"""
+        A = np.asarray(A, dtype=float)
+        rows, cols = np.nonzero(A)
+        indptr = np.zeros(A.shape[0] + 1, dtype=np.intp)
+        np.cumsum(np.bincount(rows, minlength=A.shape[0]), out=indptr[1:])
+        return cls(A[rows, cols], cols, indptr, A.shape)
+
+    @classmethod
+    def from_coo(cls, rows, cols, vals, shape):
+        """由三元组 (行, 列, 值) 构造，重复位置的值相加。"""
+        rows = np.asarray(rows, dtype=np.intp)
+        cols = np.asarray(cols, dtype=np.intp)
+        vals = np.asarray(vals, dtype=float)
+        order = np.lexsort((cols, rows))
+        rows, cols, vals = rows[order], cols[order], vals[order]
+
+        # 合并重复元素
+        if rows.size:
+            first = np.ones(rows.size, dtype=bool)
+            first[1:] = (rows[1:] != rows[:-1]) | (cols[1:] != cols[:-1])
+            starts = np.flatnonzero(first)
+            vals = np.add.reduceat(vals, starts)
+            rows, cols = rows[starts], cols[starts]
+
+        indptr = np.zeros(shape[0] + 1, dtype=np.intp)
+        np.cumsum(np.bincount(rows, minlength=shape[0]), out=indptr[1:])
+        return cls(vals, cols, indptr, shape)
+
+    @classmethod
+    def poisson_5pt(cls, nx, ny):
+        """
+        nx × ny 网格上的五点差分 Laplace 矩阵（对角元 4，相邻点 -1），
+        按行优先编号。SOR方法.py 中的 6 阶示例矩阵即 nx=3, ny=2。
+        不经过稠密矩阵，10⁶ 个未知量也只占 O(nnz) 内存。
+        """
+        n = nx * ny
+        idx = np.arange(n).reshape(ny, nx)
+        right = (idx[:, :-1].ravel(), idx[:, 1:].ravel())
+        down = (idx[:-1, :].ravel(), idx[1:, :].ravel())
+        rows = np.concatenate([idx.ravel(), right[0], right[1], down[0], down[1]])
+        cols = np.concatenate([idx.ravel(), right[1], right[0], down[1], down[0]])
+        vals = np.concatenate([np.full(n, 4.0), np.full(rows.size - n, -1.0)])
+        return cls.from_coo(rows, cols, vals, (n, n))
+
+    # --------------------- 基本运算 ---------------------
+    @property
+    def nnz(self):
+        return self.data.size
+
+    def toarray(self):
+        """转为稠密矩阵（仅用于小规模检查）。"""
+        A = np.zeros(self.shape)
+        A[self.row_ids(), self.indices] = self.data
+        return A
+
+    def row_ids(self):
+        """每个非零元所在的行号，首次调用时生成并缓存。"""
+        if self._rows is None:
+            self._rows = np.repeat(np.arange(self.shape[0]), np.diff(self.indptr))
+        return self._rows
+
+    def diagonal(self):
+        """返回对角元数组，首次调用时生成并缓存。"""
+        if self._diag is None:
+            rows = self.row_ids()
+            on_diag = rows == self.indices
+            diag = np.zeros(self.shape[0])
+            diag[rows[on_diag]] = self.data[on_diag]
+            self._diag = diag
+        return self._diag
+
+    def __matmul__(self, x):
+        x = np.asarray(x, dtype=float)
+        if x.ndim != 1 or x.size != self.shape[1]:
+            raise ValueError("x 的维度必须与矩阵列数匹配")
+        return np.bincount(self.row_ids(), weights=self.data * x[self.indices],
+                           minlength=self.shape[0])
+
+    def dot(self, x):
+        return self @ x
+
+    # --------------------- 迭代扫描 ---------------------
+    def sor_sweep(self, b, x, omega=1.0, diag=None):
+        """
+        原地执行一次 SOR 行扫描（omega = 1 即高斯-赛德尔），每行只访问该行非零元。
+
+        行内求和 Σ_j a_ij x_j 中，j < i 的 x_j 已是本轮新值，j > i 的仍是旧值，
+        减去 a_ii x_i 后即为 SOR 公式中的 sigma。
+        """
+        if diag is None:
+            diag = self.diagonal()
+        data, indices, indptr = self.data, self.indices, self.indptr
+        for i in range(self.shape[0]):
+            s, e = indptr[i], indptr[i + 1]
+            sigma = data[s:e] @ x[indices[s:e]] - diag[i] * x[i]
+            x[i] = (1 - omega) * x[i] + omega * (b[i] - sigma) / diag[i]
+        return x
+
+    def __repr__(self):
+        return f"CSRMatrix(shape={self.shape}, nnz={self.nnz})"
+
+
+# --------------------- DEMO ---------------------
+if __name__ == "__main__":
+    A = CSRMatrix.poisson_5pt(3, 2)
+    print(A)
+    print(A.toarray())
+
+    A_big = CSRMatrix.poisson_5pt(1000, 1000)
+    mem = (A_big.data.nbytes + A_big.indices.nbytes + A_big.indptr.nbytes) / 2**20
+    print(f"10⁶ 个未知量: {A_big}, 占用约 {mem:.1f} MiB"
+          f"（稠密存储需 {A_big.shape[0] ** 2 * 8 / 2**40:.1f} TiB）")
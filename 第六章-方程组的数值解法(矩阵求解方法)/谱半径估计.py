@@ -0,0 +1,102 @@
+import numpy as np
+
+from 稀疏矩阵 import CSRMatrix
+
+
+def arnoldi_spectral_radius(matvec, n, m=20, seed=0):
+    """
+    用 Arnoldi 过程估计线性算子的谱半径，只需要矩阵-向量乘积。
+
+    在 m 维 Krylov 子空间上把算子投影为上 Hessenberg 阵 H (m×m)，
+    以 H 的最大特征值模 (Ritz 值) 作为 ρ 的估计。n ≤ m 或子空间提前
+    不变时结果精确；否则通常略偏小，m 越大越准。
+
+    参数
+    ----------
+    matvec : callable
+        v ↦ Mv，接收并返回 shape (n,) 的数组。
+    n : int
+        算子维数。
+    m : int, 可选
+        Krylov 子空间维数，存储量 O(m·n)。
+    seed : int, 可选
+        初始随机向量的种子，保证结果可复现。
+
+    返回
+    -------
+    rho : float
+        谱半径估计值。
+    """
+    m = min(m, n)
+    rng = np.random.default_rng(seed)
+    V = np.zeros((m + 1, n))
+    H = np.zeros((m + 1, m))
+    v = rng.standard_normal(n)
+    V[0] = v / np.linalg.norm(v)
+
+    for j in range(m):
+        w = matvec(V[j])
+        # 修正 Gram-Schmidt 正交化
+        for i in range(j + 1):
+            H[i, j] = V[i] @ w
+            w = w - H[i, j] * V[i]
+        H[j + 1, j] = np.linalg.norm(w)
+        if H[j + 1, j] <= 1e-12 * max(1.0, np.max(np.abs(H[:j + 1, j]))):
+            m = j + 1           # Krylov 子空间已不变，Ritz 值即精确特征值
+            break
+        V[j + 1] = w / H[j + 1, j]
+
+    return float(np.max(np.abs(np.linalg.eigvals(H[:m, :m]))))
+
+
+def gauss_seidel_spectral_radius(A, m=20, seed=0):
+    """
+    估计高斯-赛德尔迭代矩阵 G = (D - L)^{-1} U 的谱半径，不构造 G 与逆矩阵。
+
+    由 (D - L) x_new = b + U x 可知，取 b = 0 对 v 做一次高斯-赛德尔扫描
+    即得 Gv，相当于一次下三角回代，稠密 O(n²)、CSRMatrix 为 O(nnz)。
+    """
+    from SOR方法 import sor_sweep   # SOR方法 也依赖本模块，延迟导入避免循环
+
+    n = A.shape[0]
+    zeros = np.zeros(n)
+    diag = A.diagonal() if isinstance(A, CSRMatrix) else np.diag(A)
+
+    def apply_G(v):
+        return sor_sweep(A, zeros, v.copy(), 1.0, diag)
+
+    return arnoldi_spectral_radius(apply_G, n, m, seed)
+
+
+def jacobi_spectral_radius(A, m=20, seed=0):
+    """
+    估计 Jacobi 迭代矩阵 T = I - D^{-1} A 的谱半径（同 雅可比迭代阵(数值).py
+    中的 rho(T)），但只做 m 次矩阵-向量乘积，不构造 T、不求稠密特征值。
+    """
+    diag = A.diagonal() if isinstance(A, CSRMatrix) else np.diag(A)
+    if np.any(diag == 0):
+        raise ZeroDivisionError("对角元存在 0，无法构造 D^{-1}")
+
+    def apply_T(v):
+        return v - (A @ v) / diag
+
+    return arnoldi_spectral_radius(apply_T, A.shape[0], m, seed)
+
+
+# --------------------- DEMO ---------------------
+if __name__ == "__main__":
+    A_demo = np.array([
+        [0.78, -0.02, -0.12, -0.14],
+        [-0.02, 0.86, -0.04, -0.06],
+        [-0.12, -0.04, 0.72, -0.08],
+        [-0.14, -0.06, -0.08, 0.74]
+    ], dtype=float)
+
+    D = np.diag(np.diag(A_demo))
+    G = np.linalg.solve(D + np.tril(A_demo, -1), -np.triu(A_demo, 1))
+    print("Arnoldi 估计 ρ(G) =", gauss_seidel_spectral_radius(A_demo))
+    print("稠密特征值 ρ(G)   =", np.max(np.abs(np.linalg.eigvals(G))))
+
+    T = np.eye(4) - A_demo / np.diag(A_demo)[:, None]
+    print("Arnoldi 估计 ρ(T) =", jacobi_spectral_radius(A_demo))
+    print("稠密特征值 ρ(T)   =", np.max(np.abs(np.linalg.eigvals(T))))
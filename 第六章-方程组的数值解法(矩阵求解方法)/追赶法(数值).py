@@ -56,14 +56,12 @@ class TriDiagonalSolver:
             
             # 可视化当前步骤
             if verbose:
-                current_augmented = np.copy(augmented)
-                # 更新当前行的系数
-                current_augmented[i, i-1] = 0.0
-                current_augmented[i, i] = alpha[i]
-                current_augmented[i, -1] = d_prime[i]
-                # 后续行的上对角线元素（如果需要显示未变化的部分）
-                # 注意：实际计算中这些元素已被beta隐式处理
-                TriDiagonalSolver._print_matrix(current_augmented, 
+                # 每步只改第 i 行的三个元素，直接在增广矩阵上原地更新，
+                # 不再整体复制 n×(n+1) 矩阵
+                augmented[i, i-1] = 0.0
+                augmented[i, i] = alpha[i]
+                augmented[i, -1] = d_prime[i]
+                TriDiagonalSolver._print_matrix(augmented, 
                     title=f"第{i}步消元（r{i+1} = r{i+1} - {beta[i-1]:.4f}*r{i}）")
         
         # 赶过程（回代）
@@ -80,6 +78,115 @@ class TriDiagonalSolver:
         
         return x
     
+    @staticmethod
+    def solve_batch(
+        a: np.ndarray,
+        b: np.ndarray,
+        c: np.ndarray,
+        d: np.ndarray,
+        tol: float = 1e-10
+    ) -> np.ndarray:
+        """
+        同时求解 m 个同阶三对角方程组（追赶法按批量维向量化）。
+
+        a : (m, n) 或 (n,)     主对角线
+        b : (m, n-1) 或 (n-1,) 上对角线
+        c : (m, n-1) 或 (n-1,) 下对角线
+        d : (m, n) 或 (n,)     右端项
+        一维参数在批量维上广播，例如同一矩阵配 m 个右端项。
+        每一步对全部 m 个方程组只做一次数组运算，返回 (m, n)。
+        """
+        a = np.atleast_2d(np.asarray(a, dtype=float))
+        b = np.atleast_2d(np.asarray(b, dtype=float))
+        c = np.atleast_2d(np.asarray(c, dtype=float))
+        d = np.atleast_2d(np.asarray(d, dtype=float))
+        n = a.shape[-1]
+        if b.shape[-1] != n-1 or c.shape[-1] != n-1 or d.shape[-1] != n:
+            raise ValueError("维度不匹配：a长度应为n，b/c应为n-1，d应为n")
+        m = max(a.shape[0], b.shape[0], c.shape[0], d.shape[0])
+
+        alpha = np.empty((m, n))
+        d_prime = np.empty((m, n))
+        alpha[:, 0] = a[:, 0]
+        d_prime[:, 0] = d[:, 0]
+
+        # 追过程
+        for i in range(1, n):
+            beta = c[:, i-1] / alpha[:, i-1]
+            alpha[:, i] = a[:, i] - beta * b[:, i-1]
+            d_prime[:, i] = d[:, i] - beta * d_prime[:, i-1]
+            if np.any(np.abs(alpha[:, i]) < tol):
+                k = int(np.argmax(np.abs(alpha[:, i]) < tol))
+                raise ValueError(f"第{k}个方程组的主元素在第{i}行接近零：{alpha[k, i]}")
+
+        # 赶过程
+        x = np.empty((m, n))
+        x[:, -1] = d_prime[:, -1] / alpha[:, -1]
+        for i in range(n-2, -1, -1):
+            x[:, i] = (d_prime[:, i] - b[:, i] * x[:, i+1]) / alpha[:, i]
+        return x
+
+    @staticmethod
+    def to_banded(A: np.ndarray, p: int, q: int) -> np.ndarray:
+        """
+        把稠密矩阵转为带状存储 ab，shape (p+q+1, n)，ab[q+i-j, j] = A[i, j]
+        （p 条下对角线、q 条上对角线；三对角即 p = q = 1）。
+        """
+        A = np.asarray(A, dtype=float)
+        n = A.shape[0]
+        ab = np.zeros((p + q + 1, n))
+        for k in range(-p, q + 1):
+            diag = np.diagonal(A, k)
+            if k >= 0:
+                ab[q - k, k:] = diag
+            else:
+                ab[q - k, :n + k] = diag
+        return ab
+
+    @staticmethod
+    def solve_banded(
+        ab: np.ndarray,
+        p: int,
+        q: int,
+        d: np.ndarray,
+        tol: float = 1e-10
+    ) -> np.ndarray:
+        """
+        带宽为 (p, q) 的带状方程组的无选主元高斯消去，运算量 O(n·p·q)。
+
+        ab : (..., p+q+1, n)  带状存储，约定同 to_banded
+        d  : (..., n)         右端项
+        前导的 ... 维为批量维，可同时求解多个同阶带状方程组。
+        """
+        ab = np.array(ab, dtype=float)
+        x = np.array(d, dtype=float)
+        ab, x = np.broadcast_arrays(ab, x[..., None, :])
+        ab, x = ab.copy(), x[..., 0, :].copy()
+        n = ab.shape[-1]
+        if ab.shape[-2] != p + q + 1:
+            raise ValueError("ab 的行数必须为 p+q+1")
+
+        # 消元：第 k 行消去其下方 p 行的第 k 列
+        for k in range(n - 1):
+            pivot = ab[..., q, k]
+            if np.any(np.abs(pivot) < tol):
+                raise ValueError(f"主元素在第{k}行接近零")
+            cols = np.arange(k, min(k + q, n - 1) + 1)
+            for i in range(k + 1, min(k + p, n - 1) + 1):
+                l = ab[..., q + i - k, k] / pivot
+                ab[..., q + i - cols, cols] -= l[..., None] * ab[..., q + k - cols, cols]
+                x[..., i] -= l * x[..., k]
+        if np.any(np.abs(ab[..., q, n - 1]) < tol):
+            raise ValueError(f"主元素在第{n - 1}行接近零")
+
+        # 回代
+        for k in range(n - 1, -1, -1):
+            cols = np.arange(k + 1, min(k + q, n - 1) + 1)
+            if cols.size:
+                x[..., k] -= np.sum(ab[..., q + k - cols, cols] * x[..., cols], axis=-1)
+            x[..., k] /= ab[..., q, k]
+        return x
+
     @staticmethod
     def _print_matrix(matrix: np.ndarray, title: str = "", precision: int = 4):
         """格式化打印矩阵"""
@@ -110,4 +217,17 @@ if __name__ == "__main__":
     solution = TriDiagonalSolver.solve(a, b, c, d, verbose=True)
     
     print("\n最终解向量：")
-    print(solution)
\ No newline at end of file
+    print(solution)
+
+    # 批量模式：1000 个右端项不同的同型方程组一次求解
+    D = np.outer(np.arange(1, 1001), d)
+    X = TriDiagonalSolver.solve_batch(a, b, c, D)
+    print("\n批量求解 1000 个方程组，第 1 个解：", X[0])
+
+    # 带状模式：p = 2 条下对角线、q = 1 条上对角线
+    A_band = np.diag([5.0] * 5) + np.diag([-1.0] * 4, 1) \
+        + np.diag([-1.0] * 4, -1) + np.diag([0.5] * 3, -2)
+    ab = TriDiagonalSolver.to_banded(A_band, p=2, q=1)
+    x_band = TriDiagonalSolver.solve_banded(ab, 2, 1, d)
+    print("带状 (p=2, q=1) 求解：", x_band)
+    print("残差：", np.max(np.abs(A_band @ x_band - np.array(d))))
@@ -1,16 +1,25 @@
 ﻿import numpy as np
 
-def gauss_seidel(A, b, x0=None, tol=1e-4, max_iter=100, verbose=True):
+from SOR方法 import sor_sweep
+from 稀疏矩阵 import CSRMatrix
+from 谱半径估计 import gauss_seidel_spectral_radius
+
+def gauss_seidel(A, b, x0=None, tol=1e-4, max_iter=100, verbose=True,
+                 check_spectrum=None):
     """
     高斯-赛德尔迭代法解线性方程组 Ax = b
     
     参数:
-    A : 系数矩阵 (n x n)
+    A : 系数矩阵 (n x n)，ndarray 或 CSRMatrix
+        CSRMatrix 时不构造稠密的 D、L、U 与 G，直接按行扫描非零元
     b : 右端向量 (n,)
     x0 : 初始向量 (n,) (默认全零向量)
     tol : 收敛阈值（无穷范数）
     max_iter : 最大迭代次数
     verbose : 是否输出中间步骤
+    check_spectrum : 是否估计谱半径 ρ(G)，ρ(G) ≥ 1 时报错 (默认与 verbose 相同)
+        估计只用下三角扫描做 Arnoldi 迭代，不求逆也不求稠密特征值；
+        关闭时求解的开销只有迭代扫描本身
     
     返回:
     x : 解向量 (n,)
@@ -19,46 +28,60 @@ def gauss_seidel(A, b, x0=None, tol=1e-4, max_iter=100, verbose=True):
     assert A.shape == (n, n), "A 必须是方阵"
     assert b.shape == (n,), "b 维度必须与 A 匹配"
 
-    # 分解矩阵 A = D - L - U
-    D = np.diag(np.diag(A))
-    L = -np.tril(A, -1)
-    U = -np.triu(A, 1)
+    if check_spectrum is None:
+        check_spectrum = verbose
+
+    sparse = isinstance(A, CSRMatrix)
+    if sparse:
+        diag = A.diagonal()
+    else:
+        A = np.asarray(A, dtype=float)
+        diag = np.diag(A).copy()
+
+    if verbose and sparse:
+        print(f"稀疏矩阵 {A}，跳过 D、L、U 与迭代矩阵 G 的构造")
+    elif verbose:
+        # 分解矩阵 A = D - L - U
+        D = np.diag(diag)
+        L = -np.tril(A, -1)
+        U = -np.triu(A, 1)
 
-    if verbose:
         print("矩阵分解：")
         print("D =\n", D)
         print("L =\n", L)
         print("U =\n", U)
 
-    # 计算迭代矩阵 G = (D - L)^{-1} @ U
-    DL_inv = np.linalg.inv(D - L)
-    G = DL_inv @ U
-    rho_G = np.max(np.abs(np.linalg.eigvals(G)))
-
-    if verbose:
+        # 仅用于展示：解方程组 (D - L) G = U 得到 G，不显式求逆
+        G = np.linalg.solve(D - L, U)
         print("\n迭代矩阵 G = (D - L)^{-1} @ U")
         print("G =\n", G)
-        print(f"谱半径 ρ(G) = {rho_G:.6f}")
 
-    if rho_G >= 1:
-        raise ValueError("迭代矩阵谱半径 ≥ 1，高斯-赛德尔法不收敛")
+    if check_spectrum:
+        rho_G = gauss_seidel_spectral_radius(A)
+
+        if verbose:
+            print(f"谱半径 ρ(G) = {rho_G:.6f}")
+
+        if rho_G >= 1:
+            raise ValueError("迭代矩阵谱半径 ≥ 1，高斯-赛德尔法不收敛")
 
     # 初始化
-    x = np.zeros(n) if x0 is None else x0.copy()
-    f = DL_inv @ b
+    x = np.zeros(n) if x0 is None else np.array(x0, dtype=float)
 
     if verbose:
         print("\n迭代过程：")
         print(f"x^(0) = {x}")
 
     for k in range(1, max_iter + 1):
-        x_new = G @ x + f
+        # 一次扫描即 x_new = G x + (D - L)^{-1} b
+        x_new = sor_sweep(A, b, x.copy(), 1.0, diag)
+        err = np.linalg.norm(x_new - x, np.inf)
 
         if verbose:
             print(f"x^{k} = {x_new}")
-            print(f"误差 ε_{k} = {np.linalg.norm(x_new - x, np.inf):.6f}")
+            print(f"误差 ε_{k} = {err:.6f}")
 
-        if np.linalg.norm(x_new - x, np.inf) < tol:
+        if err < tol:
             return x_new
 
         x = x_new
@@ -82,4 +105,8 @@ if __name__ == "__main__":
     print(f"x₁ = {solution[0]:.5f}")
     print(f"x₂ = {solution[1]:.5f}")
     print(f"x₃ = {solution[2]:.5f}")
-    print(f"x₄ = {solution[3]:.5f}")
\ No newline at end of file
+    print(f"x₄ = {solution[3]:.5f}")
+
+    # 同一方程组以 CSR 稀疏格式求解
+    solution_csr = gauss_seidel(CSRMatrix.from_dense(A), b, tol=1e-4, verbose=False)
+    print(f"\nCSR 存储求解，与稠密结果最大差: {np.max(np.abs(solution_csr - solution)):.1e}")
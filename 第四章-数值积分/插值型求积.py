@@ -1,26 +1,22 @@
+import os
+import sys
+
 import sympy as sp
 
+# lambdify 的进程级缓存与第二章插值脚本共用
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                os.pardir, "第二章-插值"))
+from 符号函数缓存 import cached_lambdify
+from 求积权表 import quadrature_table
+
 # 定义符号变量
 x, a = sp.symbols('x a')
 
-# 定义插值节点
-x0 = -a
-x1 = 0
-x2 = a
-nodes = [x0, x1, x2]
-
-# 构造Lagrange基函数
-def lagrange_basis(i, x, nodes):
-    xi = nodes[i]
-    terms = [(x - nodes[j]) / (xi - nodes[j]) for j in range(len(nodes)) if j != i]
-    return sp.simplify(sp.prod(terms))
-
-# 计算权重 A_i = \int_{-a}^{a} L_i(x) dx
-A = []
-for i in range(3):
-    Li = lagrange_basis(i, x, nodes)
-    Ai = sp.integrate(Li, (x, -a, a))
-    A.append(sp.simplify(Ai))
+# 插值节点 -a, 0, a 为 [-a, a] 上的 3 个等距节点，即闭型牛顿-柯特斯公式 n = 2。
+# A_i = \int_{-a}^{a} L_i(x) dx = 2a * w_i，w_i 为 [0, 1] 上预计算的权（查表，不再符号积分）
+nodes = [-a, 0, a]
+_, w = quadrature_table("closed", len(nodes) - 1)
+A = [sp.nsimplify(2 * wi) * a for wi in w]
 
 # 输出权重表达式
 for i, Ai in enumerate(A):
@@ -29,9 +25,9 @@ for i, Ai in enumerate(A):
 # 构造数值积分函数
 def quadrature_rule(f_expr, a_val):
     """使用已构造的公式计算积分近似值"""
-    f = sp.lambdify(x, f_expr, modules='numpy')
+    f = cached_lambdify(x, f_expr, modules='numpy')
     x_vals = [-a_val, 0, a_val]
-    A_vals = [float(Ai.subs(a, a_val)) for Ai in A]
+    A_vals = cached_lambdify(a, A, modules='numpy')(a_val)
     return sum(A_vals[i] * f(x_vals[i]) for i in range(3))
 
 # 检验代数精度
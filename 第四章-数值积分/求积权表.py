@@ -0,0 +1,129 @@
+import os
+from fractions import Fraction
+
+import numpy as np
+
+from 求积公式 import apply_rule
+
+# 预计算的最高阶数：牛顿-柯特斯 n 为区间等分数（n+1 个节点），高斯-勒让德 n 为节点数
+MAX_NEWTON_COTES = 20
+MAX_GAUSS_LEGENDRE = 100
+_VERSION = 1
+
+CACHE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "求积权表.npz")
+
+
+def _poly_mul_linear(coeffs, root):
+    """多项式（升幂系数）乘以 (t - root)，精确有理运算。"""
+    out = [Fraction(0)] * (len(coeffs) + 1)
+    for k, c in enumerate(coeffs):
+        out[k + 1] += c
+        out[k] -= root * c
+    return out
+
+
+def newton_cotes_weights(n, closed=True):
+    """
+    [0, 1] 上 n+1 个等距节点的牛顿-柯特斯公式的节点与权。
+
+    closed=True：节点 t_j = j/n（含端点，梯形 n=1、辛普森 n=2、3/8 法则 n=3）；
+    closed=False：节点 t_j = (j+1)/(n+2)（开型，不含端点，n=0 为中点公式）。
+    A_j = ∫₀¹ l_j(t) dt 用分数精确展开积分，最后才转为浮点数，
+    高阶时不会因范德蒙德矩阵病态而丢失精度。
+    """
+    if closed and n < 1:
+        raise ValueError("闭型公式要求 n >= 1")
+    nodes = [Fraction(j, n) if closed else Fraction(j + 1, n + 2) for j in range(n + 1)]
+    weights = []
+    for j, tj in enumerate(nodes):
+        poly, denom = [Fraction(1)], Fraction(1)
+        for k, tk in enumerate(nodes):
+            if k != j:
+                poly = _poly_mul_linear(poly, tk)
+                denom *= tj - tk
+        weights.append(sum(c / (k + 1) for k, c in enumerate(poly)) / denom)
+    return np.array([float(t) for t in nodes]), np.array([float(w) for w in weights])
+
+
+def gauss_legendre_weights(n):
+    """[0, 1] 上 n 点高斯-勒让德公式的节点与权（由 [-1, 1] 上的结果平移缩放）。"""
+    t, w = np.polynomial.legendre.leggauss(n)
+    return (t + 1) / 2, w / 2
+
+
+def _build_tables():
+    tables = {"version": np.array(_VERSION)}
+    for n in range(MAX_NEWTON_COTES + 1):
+        for closed, kind in ((True, "closed"), (False, "open")):
+            if closed and n == 0:
+                continue
+            tables[f"{kind}_{n}_nodes"], tables[f"{kind}_{n}_weights"] = newton_cotes_weights(n, closed)
+    for n in range(1, MAX_GAUSS_LEGENDRE + 1):
+        tables[f"gauss_{n}_nodes"], tables[f"gauss_{n}_weights"] = gauss_legendre_weights(n)
+    return tables
+
+
+_tables = None
+
+
+def _load_tables():
+    """首次使用时读取 .npz 缓存；缓存不存在或版本不符时重新计算并写入。"""
+    global _tables
+    if _tables is None:
+        try:
+            with np.load(CACHE_PATH) as data:
+                if int(data["version"]) == _VERSION:
+                    _tables = dict(data)
+        except (OSError, KeyError, ValueError):
+            pass
+    if _tables is None:
+        _tables = _build_tables()
+        try:
+            np.savez(CACHE_PATH, **_tables)
+        except OSError:
+            pass  # 目录不可写时只在内存中使用
+    return _tables
+
+
+def quadrature_table(kind, n):
+    """
+    查表返回 [0, 1] 上的 (节点, 权)，O(1)。
+
+    kind : "closed" | "open" 牛顿-柯特斯公式（n 为区间等分数）
+           "gauss" 高斯-勒让德公式（n 为节点数）
+    超出预计算范围时直接计算，不写入缓存。
+    """
+    key = f"{kind}_{n}"
+    tables = _load_tables()
+    if key + "_nodes" in tables:
+        return tables[key + "_nodes"], tables[key + "_weights"]
+    if kind == "gauss":
+        return gauss_legendre_weights(n)
+    if kind in ("closed", "open"):
+        return newton_cotes_weights(n, kind == "closed")
+    raise ValueError("kind 仅支持 'closed' | 'open' | 'gauss'")
+
+
+def quadrature(f, a, b, kind="gauss", n=5):
+    """用查表得到的公式计算 ∫ₐᵇ f(x) dx，a、b 与 f 的要求同 apply_rule。"""
+    return apply_rule(f, a, b, quadrature_table(kind, n))
+
+
+# --------------------- DEMO ---------------------
+if __name__ == "__main__":
+    import time
+
+    start = time.perf_counter()
+    _load_tables()
+    print(f"载入/生成权表：{(time.perf_counter() - start) * 1e3:.1f} ms，共 {len(_tables) // 2} 组公式")
+
+    start = time.perf_counter()
+    for _ in range(10_000):
+        quadrature_table("gauss", 20)
+    print(f"查表：{(time.perf_counter() - start) / 1e4 * 1e6:.2f} μs/次")
+
+    print("闭型 n=4（科特斯 / Boole）权 × 90 =", np.round(quadrature_table("closed", 4)[1] * 90, 10))
+    print("开型 n=2 权 × 3 =", np.round(quadrature_table("open", 2)[1] * 3, 10))
+    for kind, n in (("closed", 8), ("open", 8), ("gauss", 5), ("gauss", 10)):
+        value = quadrature(np.exp, 0, 1, kind, n)
+        print(f"{kind:<6} n={n:<2}: ∫₀¹ eˣ dx ≈ {value:.15f}，误差 {abs(value - (np.e - 1)):.1e}")
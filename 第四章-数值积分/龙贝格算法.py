@@ -1,28 +1,54 @@
 import numpy as np
 
-# 定义被积函数，处理 x = 0 处的可去奇点
+# 定义被积函数，处理 x = 0 处的可去奇点（可对整个数组求值）
 def f(x):
-    return np.sin(x) / x if x != 0 else 1.0
+    x = np.asarray(x, dtype=float)
+    nonzero = x != 0
+    return np.where(nonzero, np.sin(x) / np.where(nonzero, x, 1.0), 1.0)
+
+def _array_eval(f, x):
+    """一次调用 f 计算整个数组；f 只接受标量（如含 if 判断）时逐点计算。"""
+    try:
+        y = np.asarray(f(x), dtype=float)
+        if y.shape == x.shape:
+            return y
+    except (TypeError, ValueError):
+        pass
+    return np.array([f(xi) for xi in x], dtype=float)
 
 # 龙贝格积分函数
-def romberg_integration(f, a, b, tol=0.5e-6, max_iter=20):
-    R = np.zeros((max_iter, max_iter))
-    R[0, 0] = 0.5 * (b - a) * (f(a) + f(b))  # 初始梯形积分
-    
+def romberg_integration(f, a, b, tol=0.5e-6, max_iter=20, return_counts=False):
+    """
+    龙贝格积分。
+
+    第 n 层新增的 2^(n-1) 个中点一次性组成数组交给 f 求值；
+    外推表只保留当前一行（长 max_iter 的一维数组，原地滚动更新），
+    不再分配 max_iter × max_iter 的矩阵。
+
+    return_counts=True 时额外返回每层新增的函数求值次数列表。
+    """
+    row = np.zeros(max_iter)
+    row[0] = 0.5 * (b - a) * (f(a) + f(b))  # 初始梯形积分
+    counts = [2]
+
     for n in range(1, max_iter):
         h = (b - a) / (2 ** n)
-        sum_f = sum(f(a + (2 * k - 1) * h) for k in range(1, 2 ** (n - 1) + 1))
-        R[n, 0] = 0.5 * R[n - 1, 0] + h * sum_f  # 梯形规则细分
+        x_new = a + h * np.arange(1, 2 ** n, 2)
+        sum_f = _array_eval(f, x_new).sum()
+        counts.append(x_new.size)
 
-        # 龙贝格外推
+        # 龙贝格外推：old 依次为上一行的 R[n-1, m-1]，覆盖前先取出
+        diag_prev = row[n - 1]
+        old = row[0]
+        row[0] = 0.5 * row[0] + h * sum_f  # 梯形规则细分
         for m in range(1, n + 1):
-            R[n, m] = R[n, m - 1] + (R[n, m - 1] - R[n - 1, m - 1]) / (4 ** m - 1)
+            old, row[m] = row[m], row[m - 1] + (row[m - 1] - old) / (4 ** m - 1)
 
         # 收敛判断
-        if abs(R[n, n] - R[n - 1, n - 1]) < tol:
-            print(f"积分结果为：{R[n, n]:.8f}")
+        if abs(row[n] - diag_prev) < tol:
+            print(f"积分结果为：{row[n]:.8f}")
             print(f"使用 {n+1} 次迭代达到精度要求")
-            return R[n, n]
+            return (row[n], counts) if return_counts else row[n]
 
     raise ValueError("Romberg 积分在最大迭代次数内未收敛")
 